@@ -55,6 +55,7 @@ from .crud.props import list_props, find_props, get_prop as get_prop_v2, upsert_
 from .crud.parts import (
     parts_ref,
     find_part,
+    parts_by_name,
     ensure_part_container,
     remove_part,
     list_child_parts,
@@ -127,7 +128,7 @@ __all__ = [
     # Props CRUD
     "list_props", "find_props", "get_prop_v2", "upsert_prop", "remove_props",
     # Parts CRUD
-    "parts_ref", "find_part", "ensure_part_container", "remove_part",
+    "parts_ref", "find_part", "parts_by_name", "ensure_part_container", "remove_part",
     "list_child_parts", "add_child_part", "update_child_part", "delete_child_part",
     # Links CRUD
     "list_links", "find_links", "get_link", "upsert_link", "remove_links",
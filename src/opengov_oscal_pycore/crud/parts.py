@@ -135,6 +135,20 @@ def find_part(
     return None
 
 
+def parts_by_name(parts: Sequence[PartOrDict]) -> Dict[str, PartOrDict]:
+    """Index *parts* by name in one pass; the first part per name wins, like find_part().
+
+    The index is a snapshot and is not cached on the owner, since parts are
+    edited in place. Build it once when several names are looked up.
+    """
+    index: Dict[str, PartOrDict] = {}
+    for p in parts:
+        p_name = _get(p, "name")
+        if p_name is not None and p_name not in index:
+            index[p_name] = p
+    return index
+
+
 def _make_part(
     parent: Any,
     *,
@@ -16,6 +16,7 @@ from .domain.privacy_control import (
     set_risk_hint,
     replace_risk_scenarios,
     set_maturity_level_text,
+    set_maturity_levels,
     get_maturity_level_text,
     list_dp_goals,
     replace_dp_goals,
@@ -33,7 +34,12 @@ from .domain.privacy_control import (
     extract_maturity_domain,
     extract_maturity_requirement,
     extract_measure_category,
+
+    # single-pass extract
+    extract_bundle,
+    PrivacyExtractBundle,
 )
+from .domain._extract import extract_cache
 from .domain.sdm_catalog import (
     extract_sdm_module,
     extract_sdm_goals,
@@ -41,11 +47,15 @@ from .domain.sdm_catalog import (
     extract_implementation_level,
     extract_dp_risk_impact,
     extract_related_mappings,
+    iter_related_mappings,
+    SdmExtractBundle,
+    extract_sdm_bundle,
     set_implementation_level,
     set_dp_risk_impact,
     replace_related_mappings,
     extract_sdm_tom_description,
     extract_sdm_tom_implementation_hints,
+    extract_sdm_tom_prose_map,
     set_sdm_tom_description,
     set_sdm_tom_implementation_hints,
 )
@@ -55,6 +65,10 @@ from .domain.query import (
     find_controls_by_legal_article,
     find_controls_by_evidence,
     find_controls_by_maturity_domain,
+    find_control_by_id,
+    PropIndex,
+    build_prop_index,
+    query_cache,
 )
 from .domain.resilience_catalog import (
     extract_domain,
@@ -97,6 +111,7 @@ from .domain.profile import (
 from .domain.ssp import (
     generate_implemented_requirements,
     attach_evidence_to_ssp,
+    index_implemented_requirements,
     get_import_profile_href,
 )
 # Mapping domain (#43)
@@ -107,6 +122,8 @@ from .domain.mapping import (
     delete_mapping,
     calculate_mapping_coverage,
     resolve_transitive_mappings,
+    MappingIndex,
+    CatalogLayout,
 )
 # DiffService (#46)
 from .services.diff_service import OscalDiffService
@@ -129,6 +146,7 @@ __all__ = [
     "set_risk_hint",
     "replace_risk_scenarios",
     "set_maturity_level_text",
+    "set_maturity_levels",
     "get_maturity_level_text",
     # props field-sets
     "list_dp_goals",
@@ -149,6 +167,10 @@ __all__ = [
     "extract_maturity_domain",
     "extract_maturity_requirement",
     "extract_measure_category",
+    # single-pass extract
+    "extract_bundle",
+    "PrivacyExtractBundle",
+    "extract_cache",
     # SDM catalog domain (#3)
     "extract_sdm_module",
     "extract_sdm_goals",
@@ -156,11 +178,15 @@ __all__ = [
     "extract_implementation_level",
     "extract_dp_risk_impact",
     "extract_related_mappings",
+    "iter_related_mappings",
+    "SdmExtractBundle",
+    "extract_sdm_bundle",
     "set_implementation_level",
     "set_dp_risk_impact",
     "replace_related_mappings",
     "extract_sdm_tom_description",
     "extract_sdm_tom_implementation_hints",
+    "extract_sdm_tom_prose_map",
     "set_sdm_tom_description",
     "set_sdm_tom_implementation_hints",
     # resilience catalog domain (#4)
@@ -177,6 +203,10 @@ __all__ = [
     # query helpers (#30)
     "find_controls_by_evidence",
     "find_controls_by_maturity_domain",
+    "find_control_by_id",
+    "PropIndex",
+    "build_prop_index",
+    "query_cache",
     # converters (#14-#16)
     "control_to_privacy_summary",
     "control_to_privacy_detail",
@@ -208,6 +238,7 @@ __all__ = [
     # SSP domain (#44)
     "generate_implemented_requirements",
     "attach_evidence_to_ssp",
+    "index_implemented_requirements",
     "get_import_profile_href",
     # Mapping domain (#43)
     "list_mappings",
@@ -216,6 +247,8 @@ __all__ = [
     "delete_mapping",
     "calculate_mapping_coverage",
     "resolve_transitive_mappings",
+    "MappingIndex",
+    "CatalogLayout",
     # DiffService (#46)
     "OscalDiffService",
 ]
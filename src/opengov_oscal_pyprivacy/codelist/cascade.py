@@ -2,16 +2,28 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Final, List, Optional, Tuple
 
-from .models import CascadeRule, CodeEntry
+from pydantic import TypeAdapter
+
+from .models import CascadeEffect, CascadeRule, CodeEntry, CodeEntryMetadata
 from .registry import CodelistRegistry
 
+# Validates a whole rule list in one call (schema is built once per process)
+_RULES_ADAPTER: Final = TypeAdapter(List[CascadeRule])
+
+# Protection levels in ascending order of strictness.
+_LEVELS: Final = ("baseline", "standard", "enhanced")
+_LEVEL_IDX: Final[Dict[str, int]] = {
+    level: idx for idx, level in enumerate(_LEVELS)
+}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CascadeImpact:
-    """Result of evaluating a cascade rule."""
+    """Result of evaluating a cascade rule. Immutable and hashable."""
 
     rule_id: str
     description: str
@@ -24,6 +36,81 @@ class CascadeImpact:
     severity: str  # "error", "warning", "info"
 
 
+@dataclass(slots=True, frozen=True)
+class _CompiledEffect:
+    """A CascadeEffect with its rule-independent outputs resolved once."""
+
+    effect: CascadeEffect
+    severity: str
+    target_level_idx: int  # -1 unless it requires a known protection level
+
+
+def _compile_effect(effect: CascadeEffect) -> _CompiledEffect:
+    """Precompute severity and required level index for an effect."""
+    target_level_idx = -1
+    if effect.target_list == "protection-levels":
+        target_level_idx = _LEVEL_IDX.get(effect.value, -1)
+    return _CompiledEffect(
+        effect=effect,
+        severity="error" if effect.operator == "require" else "warning",
+        target_level_idx=target_level_idx,
+    )
+
+
+FieldAccessor = Callable[[CodeEntry], Optional[str]]
+
+
+def _compile_accessor(field_path: str) -> FieldAccessor:
+    """Build a reader for a CodeEntry field given in dot notation.
+
+    ``metadata.<attr>`` reads the metadata attribute and falls back to
+    ``metadata.extra[<attr>]`` when it is unset or unknown.
+    """
+    if field_path == "code":
+        return attrgetter("code")
+    if field_path.startswith("metadata."):
+        attr = field_path.split(".", 1)[1]
+        if attr in CodeEntryMetadata.model_fields:
+            get_attr = attrgetter(attr)
+
+            def _metadata_field(entry: CodeEntry) -> Optional[str]:
+                val = get_attr(entry.metadata)
+                if val is None:
+                    val = entry.metadata.extra.get(attr)
+                return val  # type: ignore[no-any-return]
+
+            return _metadata_field
+
+        def _metadata_extra(entry: CodeEntry) -> Optional[str]:
+            return entry.metadata.extra.get(attr)
+
+        return _metadata_extra
+    if field_path in CodeEntry.model_fields:
+        return attrgetter(field_path)
+
+    def _entry_attr(entry: CodeEntry) -> Optional[str]:
+        return getattr(entry, field_path, None)
+
+    return _entry_attr
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledRule:
+    """A CascadeRule with its field accessor and effects compiled once."""
+
+    rule: CascadeRule
+    accessor: FieldAccessor
+    effects: Tuple[_CompiledEffect, ...]
+
+
+def _compile_rule(rule: CascadeRule) -> _CompiledRule:
+    return _CompiledRule(
+        rule=rule,
+        accessor=_compile_accessor(rule.source_field),
+        effects=tuple(_compile_effect(e) for e in rule.effects),
+    )
+
+
 class CascadeService:
     """Evaluates cascade rules to determine compliance impacts.
 
@@ -40,7 +127,13 @@ class CascadeService:
         self._registry = registry
         self._rules: List[CascadeRule] = rules or []
         # Sort by priority (lower number = higher priority)
-        self._rules.sort(key=lambda r: r.priority)
+        self._rules.sort(key=attrgetter("priority"))
+        # Compiled rules grouped by source list (each group keeps priority order)
+        self._rules_by_source: Dict[str, List[_CompiledRule]] = {}
+        for rule in self._rules:
+            self._rules_by_source.setdefault(rule.source_list, []).append(
+                _compile_rule(rule)
+            )
 
     @classmethod
     def load_defaults(
@@ -48,7 +141,7 @@ class CascadeService:
     ) -> CascadeService:
         """Load default cascade rules from packaged data."""
         if registry is None:
-            registry = CodelistRegistry.load_defaults()
+            registry = CodelistRegistry.default_registry()
 
         from importlib.resources import files
 
@@ -58,14 +151,12 @@ class CascadeService:
             / "cascade_rules"
         )
 
-        rules: List[CascadeRule] = []
+        raw_rules: List[object] = []
         if rules_dir.exists():
             for path in sorted(rules_dir.glob("*.json")):
-                data = json.loads(path.read_text(encoding="utf-8"))
-                for rule_data in data:
-                    rules.append(CascadeRule.model_validate(rule_data))
+                raw_rules.extend(json.loads(path.read_bytes()))
 
-        return cls(registry, rules)
+        return cls(registry, _RULES_ADAPTER.validate_python(raw_rules))
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -75,16 +166,7 @@ class CascadeService:
         self, entry: CodeEntry, field_path: str
     ) -> Optional[str]:
         """Extract a field value from a CodeEntry using dot notation."""
-        if field_path == "code":
-            return entry.code
-        if field_path.startswith("metadata."):
-            attr = field_path.split(".", 1)[1]
-            # Try direct attribute first, then extra dict
-            val = getattr(entry.metadata, attr, None)
-            if val is None:
-                val = entry.metadata.extra.get(attr)
-            return val
-        return getattr(entry, field_path, None)
+        return _compile_accessor(field_path)(entry)
 
     def _matches_condition(
         self, value: Optional[str], condition: str
@@ -107,39 +189,65 @@ class CascadeService:
         return False
 
     def _check_violation(
-        self, effect, current_protection_level: Optional[str]
+        self, compiled: _CompiledEffect, current_protection_level: Optional[str]
     ) -> bool:
         """Check if current state violates a requirement."""
-        if (
-            effect.target_list == "protection-levels"
-            and current_protection_level
-        ):
-            levels = ["baseline", "standard", "enhanced"]
-            try:
-                current_idx = levels.index(current_protection_level)
-                required_idx = levels.index(effect.value)
-                return current_idx < required_idx
-            except ValueError:
-                return False
-        return False
+        if compiled.target_level_idx < 0 or not current_protection_level:
+            return False
+        current_idx = _LEVEL_IDX.get(current_protection_level, -1)
+        return 0 <= current_idx < compiled.target_level_idx
 
     def _get_effective_level(
         self, impacts: List[CascadeImpact], current: Optional[str]
     ) -> Optional[str]:
         """Determine the effective protection level after applying impacts."""
-        levels = ["baseline", "standard", "enhanced"]
-        max_idx = -1
-        if current and current in levels:
-            max_idx = levels.index(current)
+        max_idx = _LEVEL_IDX.get(current, -1) if current else -1
         for impact in impacts:
-            if (
-                impact.target_list == "protection-levels"
-                and impact.required_value in levels
-            ):
-                idx = levels.index(impact.required_value)
+            if impact.target_list == "protection-levels":
+                idx = _LEVEL_IDX.get(impact.required_value, -1)
                 if idx > max_idx:
                     max_idx = idx
-        return levels[max_idx] if max_idx >= 0 else None
+        return _LEVELS[max_idx] if max_idx >= 0 else None
+
+    def _emit_impacts(
+        self,
+        source_list: str,
+        source_code: str,
+        entry: CodeEntry,
+        current_pl: Optional[str],
+        impacts: List[CascadeImpact],
+        *,
+        severity: Optional[str] = None,
+    ) -> None:
+        """Append the impacts of all rules on ``source_list`` matching ``entry``.
+
+        ``current_pl`` enables violation detection for protection-level
+        effects; ``severity`` overrides the per-effect severity.
+        """
+        for compiled_rule in self._rules_by_source.get(source_list, ()):
+            rule = compiled_rule.rule
+            field_val = compiled_rule.accessor(entry)
+            if not self._matches_condition(field_val, rule.condition):
+                continue
+            for compiled in compiled_rule.effects:
+                effect = compiled.effect
+                impacts.append(
+                    CascadeImpact(
+                        rule_id=rule.rule_id,
+                        description=effect.description.get("en"),
+                        source_code=source_code,
+                        target_list=effect.target_list,
+                        target_field=effect.target_field,
+                        current_value=(
+                            current_pl
+                            if effect.target_list == "protection-levels"
+                            else None
+                        ),
+                        required_value=effect.value,
+                        is_violation=self._check_violation(compiled, current_pl),
+                        severity=severity or compiled.severity,
+                    )
+                )
 
     # ------------------------------------------------------------------
     # Public API
@@ -179,37 +287,13 @@ class CascadeService:
         except KeyError:
             return impacts
 
-        for rule in self._rules:
-            if rule.source_list != "data-categories":
-                continue
-            field_val = self._get_field_value(cat_entry, rule.source_field)
-            if not self._matches_condition(field_val, rule.condition):
-                continue
-
-            for effect in rule.effects:
-                impacts.append(
-                    CascadeImpact(
-                        rule_id=rule.rule_id,
-                        description=effect.description.get("en"),
-                        source_code=data_category,
-                        target_list=effect.target_list,
-                        target_field=effect.target_field,
-                        current_value=(
-                            current_protection_level
-                            if effect.target_list == "protection-levels"
-                            else None
-                        ),
-                        required_value=effect.value,
-                        is_violation=self._check_violation(
-                            effect, current_protection_level
-                        ),
-                        severity=(
-                            "error"
-                            if effect.operator == "require"
-                            else "warning"
-                        ),
-                    )
-                )
+        self._emit_impacts(
+            "data-categories",
+            data_category,
+            cat_entry,
+            current_protection_level,
+            impacts,
+        )
 
         # --- Evaluate protection-level rules (cascaded) ---
         effective_level = self._get_effective_level(
@@ -224,28 +308,14 @@ class CascadeService:
                 level_entry = None
 
             if level_entry:
-                for rule in self._rules:
-                    if rule.source_list != "protection-levels":
-                        continue
-                    field_val = self._get_field_value(
-                        level_entry, rule.source_field
-                    )
-                    if not self._matches_condition(field_val, rule.condition):
-                        continue
-                    for effect in rule.effects:
-                        impacts.append(
-                            CascadeImpact(
-                                rule_id=rule.rule_id,
-                                description=effect.description.get("en"),
-                                source_code=effective_level,
-                                target_list=effect.target_list,
-                                target_field=effect.target_field,
-                                current_value=None,
-                                required_value=effect.value,
-                                is_violation=False,
-                                severity="warning",
-                            )
-                        )
+                self._emit_impacts(
+                    "protection-levels",
+                    effective_level,
+                    level_entry,
+                    None,
+                    impacts,
+                    severity="warning",
+                )
 
         # --- Evaluate recipient / transfer rules ---
         if current_recipients:
@@ -256,32 +326,9 @@ class CascadeService:
                     )
                 except KeyError:
                     continue
-                for rule in self._rules:
-                    if rule.source_list != "recipients":
-                        continue
-                    field_val = self._get_field_value(
-                        rec_entry, rule.source_field
-                    )
-                    if not self._matches_condition(field_val, rule.condition):
-                        continue
-                    for effect in rule.effects:
-                        impacts.append(
-                            CascadeImpact(
-                                rule_id=rule.rule_id,
-                                description=effect.description.get("en"),
-                                source_code=recipient,
-                                target_list=effect.target_list,
-                                target_field=effect.target_field,
-                                current_value=None,
-                                required_value=effect.value,
-                                is_violation=False,
-                                severity=(
-                                    "error"
-                                    if effect.operator == "require"
-                                    else "warning"
-                                ),
-                            )
-                        )
+                self._emit_impacts(
+                    "recipients", recipient, rec_entry, None, impacts
+                )
 
         return impacts
 
@@ -295,14 +342,21 @@ class CascadeService:
         Returns only NEW impacts that were not already required by the
         old data category.
         """
-        old_impacts = self.evaluate_impact(old_data_category)
-        new_impacts = self.evaluate_impact(new_data_category)
+        # Evaluation is deterministic: an unchanged category adds nothing
+        if old_data_category == new_data_category:
+            return []
 
-        old_rules = {
-            (i.rule_id, i.target_list, i.required_value) for i in old_impacts
-        }
+        new_impacts = self.evaluate_impact(new_data_category)
+        if not new_impacts:
+            return new_impacts
+        old_keys = frozenset(
+            (i.rule_id, i.target_list, i.required_value)
+            for i in self.evaluate_impact(old_data_category)
+        )
+        if not old_keys:
+            return new_impacts
         return [
             i
             for i in new_impacts
-            if (i.rule_id, i.target_list, i.required_value) not in old_rules
+            if (i.rule_id, i.target_list, i.required_value) not in old_keys
         ]
@@ -1,13 +1,67 @@
 from __future__ import annotations
 
-import io
+from functools import lru_cache
 from pathlib import Path
-from xml.etree.ElementTree import Element, ElementTree, SubElement, indent
+from typing import List
+from xml.sax.saxutils import escape
 
 from ..models import Codelist
 
 GC_NS = "http://docs.oasis-open.org/codelist/ns/genericode/1.0/"
 
+# The document layout is fixed, so it is rendered from string templates
+# instead of building and serialising an element tree on every export.
+_HEADER_TEMPLATE = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    f'<gc:CodeList xmlns:gc="{GC_NS}">\n'
+    "  <gc:Identification>\n"
+    "    <gc:ShortName>{list_id}</gc:ShortName>\n"
+    "    <gc:CanonicalUri>{urn_prefix}:{list_id}</gc:CanonicalUri>\n"
+    "    <gc:Version>{version}</gc:Version>\n"
+    "  </gc:Identification>\n"
+    "  <gc:ColumnSet>\n"
+    '    <gc:Column Id="code" Use="required">\n'
+    "      <gc:ShortName>Code</gc:ShortName>\n"
+    '      <gc:Data Type="string" />\n'
+    "    </gc:Column>\n"
+    '    <gc:Column Id="name" Use="required">\n'
+    "      <gc:ShortName>Name</gc:ShortName>\n"
+    '      <gc:Data Type="string" />\n'
+    "    </gc:Column>\n"
+    '    <gc:Key Id="codeKey">\n'
+    '      <gc:ColumnRef Ref="code" />\n'
+    "    </gc:Key>\n"
+    "  </gc:ColumnSet>\n"
+)
+
+_ROW_TEMPLATE = (
+    "    <gc:Row>\n"
+    '      <gc:Value ColumnRef="code">\n'
+    "        {code}\n"
+    "      </gc:Value>\n"
+    '      <gc:Value ColumnRef="name">\n'
+    "        {name}\n"
+    "      </gc:Value>\n"
+    "    </gc:Row>\n"
+)
+
+
+@lru_cache(maxsize=128)
+def _build_header(list_id: str, version: str, urn_prefix: str) -> str:
+    """Render everything up to the SimpleCodeList (cached per identity)."""
+    return _HEADER_TEMPLATE.format(
+        list_id=escape(list_id),
+        version=escape(version),
+        urn_prefix=escape(urn_prefix),
+    )
+
+
+def _simple_value(text: str) -> str:
+    """Render a gc:SimpleValue element, self-closing when empty."""
+    if not text:
+        return "<gc:SimpleValue />"
+    return f"<gc:SimpleValue>{escape(text)}</gc:SimpleValue>"
+
 
 def export_genericode(
     codelist: Codelist,
@@ -22,72 +76,27 @@ def export_genericode(
         locale: Language for display labels (default: "de" for XÖV compat)
         urn_prefix: URN prefix for CanonicalUri
     """
-    root = Element("gc:CodeList")
-    root.set("xmlns:gc", GC_NS)
-
-    # Identification
-    ident = SubElement(root, "gc:Identification")
-    short_name = SubElement(ident, "gc:ShortName")
-    short_name.text = codelist.list_id
-
-    canonical_uri = SubElement(ident, "gc:CanonicalUri")
-    canonical_uri.text = f"{urn_prefix}:{codelist.list_id}"
-
-    version = SubElement(ident, "gc:Version")
-    version.text = codelist.version
-
-    # ColumnSet
-    column_set = SubElement(root, "gc:ColumnSet")
-
-    # Code column
-    col_code = SubElement(column_set, "gc:Column")
-    col_code.set("Id", "code")
-    col_code.set("Use", "required")
-    col_code_short = SubElement(col_code, "gc:ShortName")
-    col_code_short.text = "Code"
-    col_code_data = SubElement(col_code, "gc:Data")
-    col_code_data.set("Type", "string")
-
-    # Name column
-    col_name = SubElement(column_set, "gc:Column")
-    col_name.set("Id", "name")
-    col_name.set("Use", "required")
-    col_name_short = SubElement(col_name, "gc:ShortName")
-    col_name_short.text = "Name"
-    col_name_data = SubElement(col_name, "gc:Data")
-    col_name_data.set("Type", "string")
-
-    # Key
-    key_elem = SubElement(column_set, "gc:Key")
-    key_elem.set("Id", "codeKey")
-    key_col_ref = SubElement(key_elem, "gc:ColumnRef")
-    key_col_ref.set("Ref", "code")
+    parts: List[str] = [
+        _build_header(codelist.list_id, codelist.version, urn_prefix)
+    ]
 
     # SimpleCodeList
-    simple_list = SubElement(root, "gc:SimpleCodeList")
-    for entry in codelist.entries:
-        if entry.deprecated:
-            continue
-        row = SubElement(simple_list, "gc:Row")
-
-        # Code value
-        val_code = SubElement(row, "gc:Value")
-        val_code.set("ColumnRef", "code")
-        sv_code = SubElement(val_code, "gc:SimpleValue")
-        sv_code.text = entry.xoev_code if entry.xoev_code else entry.code
-
-        # Name value (localized)
-        val_name = SubElement(row, "gc:Value")
-        val_name.set("ColumnRef", "name")
-        sv_name = SubElement(val_name, "gc:SimpleValue")
-        sv_name.text = entry.get_label(locale)
-
-    indent(root, space="  ")
-
-    stream = io.BytesIO()
-    tree = ElementTree(root)
-    tree.write(stream, encoding="utf-8", xml_declaration=True)
-    return stream.getvalue().decode("utf-8")
+    rows = [
+        _ROW_TEMPLATE.format(
+            code=_simple_value(entry.xoev_code if entry.xoev_code else entry.code),
+            name=_simple_value(entry.get_label(locale)),
+        )
+        for entry in codelist.entries
+        if not entry.deprecated
+    ]
+    if rows:
+        parts.append("  <gc:SimpleCodeList>\n")
+        parts.extend(rows)
+        parts.append("  </gc:SimpleCodeList>\n")
+    else:
+        parts.append("  <gc:SimpleCodeList />\n")
+    parts.append("</gc:CodeList>")
+    return "".join(parts)
 
 
 def export_genericode_to_file(
@@ -1,12 +1,31 @@
 from __future__ import annotations
 
+import re
 from typing import List, Optional
-from xml.etree.ElementTree import Element, fromstring
+from xml.etree.ElementTree import Element
 
 from ..models import CodeEntry, CodeLabel, Codelist
 
+try:
+    from lxml import etree as _etree  # type: ignore[import-untyped]
+
+    _HAS_LXML = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    from xml.etree import ElementTree as _etree
+
+    _HAS_LXML = False
+
 GC_NS = "http://docs.oasis-open.org/codelist/ns/genericode/1.0/"
 
+# Namespaced tags used in the per-row hot loop, formatted once at import time.
+_ROW_TAG = f"{{{GC_NS}}}Row"
+_VALUE_TAG = f"{{{GC_NS}}}Value"
+_SV_TAG = f"{{{GC_NS}}}SimpleValue"
+
+# The encoding named in an XML declaration is meaningless for already decoded
+# str input, and lxml rejects str input that carries one.
+_XML_DECL = re.compile(r"\A\ufeff?\s*<\?xml[^>]*\?>")
+
 
 def _find(element: Element, tag: str) -> Optional[Element]:
     """Find a child element with Genericode namespace."""
@@ -31,6 +50,10 @@ def import_genericode(xml_str: str, *, namespace_uri: str = "") -> Codelist:
     so metadata like groups, definitions, cascade_rules, etc. are lost.
     The imported Codelist will have minimal CodeEntry objects.
 
+    Models are built with ``model_construct`` (no Pydantic validation):
+    every field is a plain string taken from the parsed XML, and rows
+    without a code are skipped.
+
     Args:
         xml_str: Genericode 1.0 XML string to parse.
         namespace_uri: Override the namespace_uri (default: use CanonicalUri
@@ -39,7 +62,11 @@ def import_genericode(xml_str: str, *, namespace_uri: str = "") -> Codelist:
     Returns:
         A Codelist with entries reconstructed from the XML rows.
     """
-    root = fromstring(xml_str)
+    text = _XML_DECL.sub("", xml_str, count=1)
+    if _HAS_LXML:
+        root = _etree.fromstring(text, _etree.XMLParser(resolve_entities=False))
+    else:
+        root = _etree.fromstring(text)
 
     # Extract identification
     ident = _find(root, "Identification")
@@ -61,12 +88,12 @@ def import_genericode(xml_str: str, *, namespace_uri: str = "") -> Codelist:
     entries: List[CodeEntry] = []
     simple_list = _find(root, "SimpleCodeList")
     if simple_list is not None:
-        for row in _findall(simple_list, "Row"):
+        for row in simple_list.iterfind(_ROW_TAG):
             code_value = ""
             name_value = ""
-            for value_elem in _findall(row, "Value"):
+            for value_elem in row.iterfind(_VALUE_TAG):
                 col_ref = value_elem.get("ColumnRef", "")
-                sv = _find(value_elem, "SimpleValue")
+                sv = value_elem.find(_SV_TAG)
                 text = (sv.text or "") if sv is not None else ""
                 if col_ref == "code":
                     code_value = text
@@ -78,15 +105,15 @@ def import_genericode(xml_str: str, *, namespace_uri: str = "") -> Codelist:
                 # but on import we don't know the original code, so we use
                 # the XML code as-is. The name goes into the 'en' label
                 # field (the only field available from a single-locale XML).
-                entry = CodeEntry(
+                entry = CodeEntry.model_construct(
                     code=code_value,
-                    labels=CodeLabel(en=name_value or code_value),
+                    labels=CodeLabel.model_construct(en=name_value or code_value),
                 )
                 entries.append(entry)
 
-    title_label = CodeLabel(en=list_id)
+    title_label = CodeLabel.model_construct(en=list_id)
 
-    return Codelist(
+    return Codelist.model_construct(
         list_id=list_id,
         version=version,
         namespace_uri=ns_uri,
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -21,7 +22,11 @@ class CodeLabel(CodelistBaseModel):
 
     def get(self, locale: str = "en", fallback_code: Optional[str] = None) -> str:
         """Get label for locale with fallback chain: locale -> en -> fallback_code -> en."""
-        value = getattr(self, locale, None)
+        # "en" is required, so the common case never reaches the fallbacks
+        if locale == "en":
+            return self.en
+        getter = _LABEL_GETTERS.get(locale)
+        value = getter(self) if getter is not None else None
         if value is not None:
             return value
         if self.en:
@@ -31,6 +36,12 @@ class CodeLabel(CodelistBaseModel):
         return self.en
 
 
+# Per-locale field readers for CodeLabel.get; unknown locales map to None
+_LABEL_GETTERS: Dict[str, Callable[[CodeLabel], Optional[str]]] = {
+    name: attrgetter(name) for name in CodeLabel.model_fields
+}
+
+
 class CodeEntryMetadata(CodelistBaseModel):
     """Domain-specific metadata for a code entry."""
 
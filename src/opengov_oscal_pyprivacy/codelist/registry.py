@@ -1,21 +1,161 @@
 from __future__ import annotations
 
+import threading
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .models import Codelist, CodeEntry
 from .loader import load_codelist_dir
 
+# Separates labels in the search haystack; queries containing it never match
+_SEP = "\x00"
+
+
+class _LabelIndex:
+    """Lowercased labels of one codelist/locale joined into a single haystack.
+
+    A query is located with repeated ``str.find`` over the haystack, which
+    skips non-matching labels in C instead of testing each one in Python.
+    """
+
+    __slots__ = ("labels", "entries", "haystack", "starts", "_prefix_keys", "_by_label")
+
+    def __init__(self, entries: List[CodeEntry], locale: str) -> None:
+        self.entries = entries
+        self.labels = [e.get_label(locale).lower() for e in entries]
+        self.haystack = _SEP.join(self.labels)
+        self.starts: List[int] = []
+        pos = 0
+        for label in self.labels:
+            self.starts.append(pos)
+            pos += len(label) + 1
+        # Sorted (key, entry position) pairs for prefix lookups, built lazily
+        self._prefix_keys: Optional[List[Tuple[str, int]]] = None
+        # Lowercased label -> first entry with that label, built lazily
+        self._by_label: Optional[Dict[str, CodeEntry]] = None
+
+    def find(self, query_lower: str) -> List[CodeEntry]:
+        """Return entries whose lowercased label contains ``query_lower``."""
+        if len(query_lower) < 2:
+            # Short queries match most labels; a plain scan is cheaper
+            return [
+                e for label, e in zip(self.labels, self.entries) if query_lower in label
+            ]
+        if _SEP in query_lower:
+            return []
+        results: List[CodeEntry] = []
+        starts = self.starts
+        n = len(starts)
+        find = self.haystack.find
+        i = find(query_lower)
+        while i != -1:
+            k = bisect_right(starts, i) - 1
+            results.append(self.entries[k])
+            if k + 1 >= n:
+                break
+            i = find(query_lower, starts[k + 1])
+        return results
+
+    def find_prefix(self, prefix_lower: str) -> List[CodeEntry]:
+        """Return entries whose label, or a word in it, starts with the prefix."""
+        keys = self._prefix_keys
+        if keys is None:
+            pairs = set()
+            for pos, label in enumerate(self.labels):
+                pairs.add((label, pos))
+                pairs.update((word, pos) for word in label.split())
+            keys = self._prefix_keys = sorted(pairs)
+        hits = set()
+        i = bisect_left(keys, (prefix_lower,))
+        while i < len(keys) and keys[i][0].startswith(prefix_lower):
+            hits.add(keys[i][1])
+            i += 1
+        return [self.entries[pos] for pos in sorted(hits)]
+
+    def get(self, label_lower: str) -> Optional[CodeEntry]:
+        """Return the first entry whose lowercased label equals ``label_lower``."""
+        by_label = self._by_label
+        if by_label is None:
+            by_label = {}
+            for label, entry in zip(self.labels, self.entries):
+                by_label.setdefault(label, entry)
+            self._by_label = by_label
+        return by_label.get(label_lower)
+
+
+class _CodeIndex:
+    """Codes of one codelist, precomputed for every list_codes() filter."""
+
+    __slots__ = ("active", "all", "by_group_active", "by_group_all")
+
+    def __init__(self, codelist: Codelist) -> None:
+        active: List[str] = []
+        all_codes: List[str] = []
+        by_group_active: Dict[Optional[str], List[str]] = {}
+        by_group_all: Dict[Optional[str], List[str]] = {}
+        for entry in codelist.entries:
+            group = entry.metadata.group
+            all_codes.append(entry.code)
+            by_group_all.setdefault(group, []).append(entry.code)
+            if not entry.deprecated:
+                active.append(entry.code)
+                by_group_active.setdefault(group, []).append(entry.code)
+        self.active = tuple(active)
+        self.all = tuple(all_codes)
+        self.by_group_active = {g: tuple(c) for g, c in by_group_active.items()}
+        self.by_group_all = {g: tuple(c) for g, c in by_group_all.items()}
+
+    def codes(self, group: Optional[str], include_deprecated: bool) -> Tuple[str, ...]:
+        if group is None:
+            return self.all if include_deprecated else self.active
+        by_group = self.by_group_all if include_deprecated else self.by_group_active
+        return by_group.get(group, ())
+
+
+_DEFAULT_REGISTRY: Optional["CodelistRegistry"] = None
+_DEFAULT_REGISTRY_LOCK = threading.Lock()
+
 
 class CodelistRegistry:
-    """Central registry for all codelists. Thread-safe singleton via load_defaults()."""
+    """Central registry for all codelists.
+
+    ``load_defaults()`` returns a fresh registry; ``default_registry()``
+    returns one shared, lazily loaded instance.
+
+    Registered codelists are treated as immutable: derived lookup data is
+    cached per list and only rebuilt when a list is (re-)registered.
+    """
 
     def __init__(self) -> None:
         self._lists: Dict[str, Codelist] = {}
+        # (list_id, locale) -> lowercased label haystack for search()
+        self._search_index: Dict[Tuple[str, str], _LabelIndex] = {}
+        # list_id -> precomputed codes for list_codes(), built on register()
+        self._code_index: Dict[str, _CodeIndex] = {}
+        # Sorted list IDs for list_ids(), reset on register()
+        self._sorted_ids: Optional[Tuple[str, ...]] = None
 
     def register(self, codelist: Codelist) -> None:
         """Register a codelist. Overwrites existing with same list_id."""
         self._lists[codelist.list_id] = codelist
+        self._sorted_ids = None
+        self._invalidate(codelist.list_id)
+        self._code_index[codelist.list_id] = _CodeIndex(codelist)
+
+    def _invalidate(self, list_id: str) -> None:
+        """Drop cached lookup data derived from a codelist."""
+        for key in [k for k in self._search_index if k[0] == list_id]:
+            del self._search_index[key]
+
+    def _label_index(self, list_id: str, locale: str) -> _LabelIndex:
+        """Return the (lazily built) label index for a list and locale."""
+        key = (list_id, locale)
+        index = self._search_index.get(key)
+        if index is None:
+            index = _LabelIndex(self.get_list(list_id).entries, locale)
+            self._search_index[key] = index
+        return index
 
     def get_list(self, list_id: str) -> Codelist:
         """Get a codelist by ID. Raises KeyError if not found."""
@@ -53,14 +193,30 @@ class CodelistRegistry:
         self, list_id: str, query: str, locale: str = "en"
     ) -> List[CodeEntry]:
         """Search entries by label substring (case-insensitive)."""
-        cl = self.get_list(list_id)
-        query_lower = query.lower()
-        results = []
-        for entry in cl.entries:
-            label = entry.get_label(locale)
-            if query_lower in label.lower():
-                results.append(entry)
-        return results
+        index = self._label_index(list_id, locale)
+        # str.lower() already has an ASCII fast path in CPython; translate()
+        # with an ASCII table measured 10-20x slower for typical queries.
+        return index.find(query.lower())
+
+    def search_prefix(
+        self, list_id: str, prefix: str, locale: str = "en"
+    ) -> List[CodeEntry]:
+        """Search entries whose label or one of its words starts with ``prefix``.
+
+        Case-insensitive, intended for autocomplete. Uses a sorted key index
+        (O(log n) per query) instead of scanning every label.
+        """
+        return self._label_index(list_id, locale).find_prefix(prefix.lower())
+
+    def get_by_label(
+        self, list_id: str, label: str, locale: str = "en"
+    ) -> Optional[CodeEntry]:
+        """Return the entry whose label equals ``label`` (case-insensitive), or None.
+
+        O(1) reverse lookup for resolving human-entered values; if several
+        entries share a label, the first one wins.
+        """
+        return self._label_index(list_id, locale).get(label.lower())
 
     def list_codes(
         self,
@@ -70,19 +226,16 @@ class CodelistRegistry:
         include_deprecated: bool = False,
     ) -> List[str]:
         """List all codes, optionally filtered by group."""
-        cl = self.get_list(list_id)
-        codes = []
-        for entry in cl.entries:
-            if not include_deprecated and entry.deprecated:
-                continue
-            if group is not None and entry.metadata.group != group:
-                continue
-            codes.append(entry.code)
-        return codes
+        codes = self._code_index[list_id].codes(group, include_deprecated)
+        # Hand out a fresh list so callers cannot corrupt the index
+        return list(codes)
 
     def list_ids(self) -> List[str]:
         """Return all registered codelist IDs."""
-        return sorted(self._lists.keys())
+        ids = self._sorted_ids
+        if ids is None:
+            ids = self._sorted_ids = tuple(sorted(self._lists))
+        return list(ids)
 
     @classmethod
     def load_defaults(cls) -> CodelistRegistry:
@@ -97,3 +250,17 @@ class CodelistRegistry:
             for cl in load_codelist_dir(data_dir):
                 registry.register(cl)
         return registry
+
+    @staticmethod
+    def default_registry() -> CodelistRegistry:
+        """Return the process-wide registry of the packaged codelists.
+
+        Loaded on first use and shared by all callers, so registering lists
+        on it affects everyone; use :meth:`load_defaults` for a private copy.
+        """
+        global _DEFAULT_REGISTRY
+        if _DEFAULT_REGISTRY is None:
+            with _DEFAULT_REGISTRY_LOCK:
+                if _DEFAULT_REGISTRY is None:
+                    _DEFAULT_REGISTRY = CodelistRegistry.load_defaults()
+        return _DEFAULT_REGISTRY
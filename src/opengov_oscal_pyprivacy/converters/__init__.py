@@ -4,20 +4,24 @@ from .resilience_converter import control_to_security_control, group_to_resilien
 from .privacy_converter import (
     control_to_privacy_summary,
     control_to_privacy_detail,
+    LazyPrivacyControlDetail,
     group_to_privacy_summary,
     group_to_privacy_detail,
+    iter_privacy_control_summaries,
 )
 from .ropa_converter import (
     control_to_ropa_summary,
     control_to_ropa_detail,
     group_to_ropa_summary,
     group_to_ropa_detail,
+    iter_ropa_control_summaries,
 )
 from .dpia_converter import (
     control_to_dpia_summary,
     control_to_dpia_detail,
     group_to_dpia_summary,
     group_to_dpia_detail,
+    iter_dpia_control_summaries,
 )
 
 __all__ = [
@@ -32,16 +36,20 @@ __all__ = [
     "group_to_resilience_detail",
     "control_to_privacy_summary",
     "control_to_privacy_detail",
+    "LazyPrivacyControlDetail",
     "group_to_privacy_summary",
     "group_to_privacy_detail",
+    "iter_privacy_control_summaries",
     # ROPA (#28)
     "control_to_ropa_summary",
     "control_to_ropa_detail",
     "group_to_ropa_summary",
     "group_to_ropa_detail",
+    "iter_ropa_control_summaries",
     # DPIA (#29)
     "control_to_dpia_summary",
     "control_to_dpia_detail",
     "group_to_dpia_summary",
     "group_to_dpia_detail",
+    "iter_dpia_control_summaries",
 ]
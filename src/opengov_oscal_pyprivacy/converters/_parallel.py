@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+"""
+Data-parallel map over group controls.
+
+The per-control summary converters only read ``control.props`` and build a
+new DTO, so converting the controls of a group is embarrassingly parallel.
+With the GIL enabled, threads cannot speed up this pure-Python work (and a
+process pool would spend more time pickling controls than converting them),
+so the fan-out only happens on free-threaded CPython builds.
+"""
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Below this many controls the pool overhead outweighs the gain.
+PARALLEL_THRESHOLD = 64
+
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _gil_disabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ThreadPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    thread_name_prefix="pyprivacy-convert",
+                )
+    return _POOL
+
+
+def map_controls(fn: Callable[[_T], _R], controls: Sequence[_T]) -> List[_R]:
+    """Return ``[fn(c) for c in controls]``, fanned out over threads when it pays off.
+
+    *fn* must not mutate the controls. Result order always matches *controls*.
+    """
+    if len(controls) > PARALLEL_THRESHOLD and _gil_disabled():
+        return list(_get_pool().map(fn, controls))
+    return list(map(fn, controls))
@@ -6,12 +6,15 @@ Privacy Catalog Converter (#14).
 Compose domain extract functions into Privacy DTOs.
 """
 
-from typing import Optional
+import sys
+from functools import cached_property, partial
+from typing import Any, Dict, Iterator, List, Optional
 
 from opengov_oscal_pycore.models import Control, Group
-from opengov_oscal_pycore.crud.parts import parts_ref, find_part, _get
+from opengov_oscal_pycore.crud.parts import parts_ref
 
-from ..dto.common import TextItem
+from ._parallel import map_controls
+from ..dto.common import TEXT_ITEM_LIST_ADAPTER, TextItem
 from ..dto.privacy_catalog import (
     PrivacyControlSummary, PrivacyControlDetail,
     PrivacyGroupSummary, PrivacyGroupDetail,
@@ -19,21 +22,10 @@ from ..dto.privacy_catalog import (
 )
 from ..domain.privacy_control import (
     extract_tom_id, extract_legal_articles,
-    list_dp_goals, extract_statement,
-    extract_risk_hint, extract_risk_scenarios,
-    extract_maturity_level_texts,
-    list_typical_measures, list_assessment_questions,
+    list_dp_goals, extract_bundle, _intern,
+    PrivacyExtractBundle,
 )
-from ..domain.risk_guidance import get_risk_impact_scenarios, RiskImpactScenario
-
-
-def _extract_maturity_hints_prose(control: Control) -> Optional[str]:
-    """Return the maturity-hints container prose, or None."""
-    parts = parts_ref(control)
-    part = find_part(parts, name="maturity-hints")
-    if part is None:
-        return None
-    return _get(part, "prose")
+from ..domain.risk_guidance import get_risk_impact_scenarios, ImpactLevel, RiskImpactScenario
 
 
 def _to_risk_impact_dto(scenario: Optional[RiskImpactScenario]) -> Optional[PrivacyRiskImpactScenario]:
@@ -57,55 +49,121 @@ def control_to_privacy_summary(
     return PrivacyControlSummary(
         id=control.id,
         title=control.title or "",
-        group_id=group_id,
+        group_id=_intern(group_id),
         tom_id=extract_tom_id(control),
         dsgvo_articles=extract_legal_articles(control),
         dp_goals=list_dp_goals(control),
     )
 
 
+class LazyPrivacyControlDetail:
+    """PrivacyControlDetail fields of a control, each computed on first access.
+
+    ``id``, ``title``, ``group_id`` and ``ctrl_class`` are read eagerly. The
+    first extracted field runs one :func:`extract_bundle` pass, and the
+    ``risk_impact_*`` fields run one risk-guidance walk. Use :meth:`to_dto`
+    to materialize a :class:`PrivacyControlDetail`.
+    """
+
+    def __init__(self, control: Control, *, group_id: Optional[str] = None) -> None:
+        self.control = control
+        self.id = control.id
+        self.title = control.title or ""
+        self.group_id = _intern(group_id)
+        self.ctrl_class = sys.intern(control.class_ or "")
+
+    @cached_property
+    def _parts(self) -> List[Any]:
+        return parts_ref(self.control)
+
+    @cached_property
+    def _bundle(self) -> PrivacyExtractBundle:
+        return extract_bundle(self.control, parts=self._parts)
+
+    @cached_property
+    def _risk_impacts(self) -> Dict[ImpactLevel, RiskImpactScenario]:
+        return get_risk_impact_scenarios(self.control, parts=self._parts)
+
+    @cached_property
+    def tom_id(self) -> Optional[str]:
+        return self._bundle.tom_id
+
+    @cached_property
+    def dsgvo_articles(self) -> List[str]:
+        return self._bundle.legal_articles
+
+    @cached_property
+    def dp_goals(self) -> List[str]:
+        return self._bundle.dp_goals
+
+    @cached_property
+    def statement(self) -> Optional[str]:
+        return self._bundle.statement
+
+    @cached_property
+    def maturity_hints(self) -> Optional[str]:
+        return self._bundle.maturity_hints
+
+    @cached_property
+    def maturity_level_1(self) -> Optional[str]:
+        return self._bundle.maturity_level_1
+
+    @cached_property
+    def maturity_level_3(self) -> Optional[str]:
+        return self._bundle.maturity_level_3
+
+    @cached_property
+    def maturity_level_5(self) -> Optional[str]:
+        return self._bundle.maturity_level_5
+
+    @cached_property
+    def typical_measures(self) -> List[TextItem]:
+        return TEXT_ITEM_LIST_ADAPTER.validate_python(self._bundle.typical_measures)
+
+    @cached_property
+    def assessment_questions(self) -> List[TextItem]:
+        return TEXT_ITEM_LIST_ADAPTER.validate_python(self._bundle.assessment_questions)
+
+    @cached_property
+    def risk_hint(self) -> Optional[str]:
+        return self._bundle.risk_hint
+
+    @cached_property
+    def risk_scenarios(self) -> List[PrivacyRiskScenario]:
+        return [
+            PrivacyRiskScenario(
+                title=s.get("title"),
+                description=s.get("description", s.get("prose", "")),
+            )
+            for s in self._bundle.risk_scenarios
+        ]
+
+    @cached_property
+    def risk_impact_normal(self) -> Optional[PrivacyRiskImpactScenario]:
+        return _to_risk_impact_dto(self._risk_impacts.get("normal"))
+
+    @cached_property
+    def risk_impact_moderate(self) -> Optional[PrivacyRiskImpactScenario]:
+        return _to_risk_impact_dto(self._risk_impacts.get("moderate"))
+
+    @cached_property
+    def risk_impact_high(self) -> Optional[PrivacyRiskImpactScenario]:
+        return _to_risk_impact_dto(self._risk_impacts.get("high"))
+
+    def to_dto(self) -> PrivacyControlDetail:
+        """Compute any remaining fields and build the PrivacyControlDetail DTO."""
+        return PrivacyControlDetail(
+            **{name: getattr(self, name) for name in PrivacyControlDetail.model_fields}
+        )
+
+
 def control_to_privacy_detail(
     control: Control,
     *,
     group_id: Optional[str] = None,
 ) -> PrivacyControlDetail:
     """Convert a Control to a PrivacyControlDetail DTO."""
-    risk_impacts = get_risk_impact_scenarios(control)
-    maturity = extract_maturity_level_texts(control)
-
-    return PrivacyControlDetail(
-        id=control.id,
-        ctrl_class=control.class_ or "",
-        title=control.title or "",
-        group_id=group_id,
-        tom_id=extract_tom_id(control),
-        dsgvo_articles=extract_legal_articles(control),
-        dp_goals=list_dp_goals(control),
-        statement=extract_statement(control),
-        maturity_hints=_extract_maturity_hints_prose(control),
-        maturity_level_1=maturity.get(1),
-        maturity_level_3=maturity.get(3),
-        maturity_level_5=maturity.get(5),
-        typical_measures=[
-            TextItem(id=m["id"], prose=m["prose"])
-            for m in list_typical_measures(control)
-        ],
-        assessment_questions=[
-            TextItem(id=q["id"], prose=q["prose"])
-            for q in list_assessment_questions(control)
-        ],
-        risk_hint=extract_risk_hint(control),
-        risk_scenarios=[
-            PrivacyRiskScenario(
-                title=s.get("title"),
-                description=s.get("description", s.get("prose", "")),
-            )
-            for s in extract_risk_scenarios(control)
-        ],
-        risk_impact_normal=_to_risk_impact_dto(risk_impacts.get("normal")),
-        risk_impact_moderate=_to_risk_impact_dto(risk_impacts.get("moderate")),
-        risk_impact_high=_to_risk_impact_dto(risk_impacts.get("high")),
-    )
+    return LazyPrivacyControlDetail(control, group_id=group_id).to_dto()
 
 
 def group_to_privacy_summary(group: Group) -> PrivacyGroupSummary:
@@ -117,6 +175,16 @@ def group_to_privacy_summary(group: Group) -> PrivacyGroupSummary:
     )
 
 
+def iter_privacy_control_summaries(group: Group) -> Iterator[PrivacyControlSummary]:
+    """Yield the group's control summaries one at a time.
+
+    Streaming alternative to ``group_to_privacy_detail(group).controls`` for
+    callers that encode or forward controls without keeping the full list.
+    """
+    for c in group.controls:
+        yield control_to_privacy_summary(c, group_id=group.id)
+
+
 def group_to_privacy_detail(
     group: Group,
     *,
@@ -125,10 +193,8 @@ def group_to_privacy_detail(
     """Convert a Group to a PrivacyGroupDetail DTO."""
     controls = []
     if include_controls:
-        controls = [
-            control_to_privacy_summary(c, group_id=group.id)
-            for c in group.controls
-        ]
+        to_summary = partial(control_to_privacy_summary, group_id=group.id)
+        controls = map_controls(to_summary, group.controls)
     return PrivacyGroupDetail(
         id=group.id,
         class_=group.class_,
@@ -6,12 +6,14 @@ ROPA Converter (#28).
 Compose domain extract functions into ROPA DTOs.
 """
 
-from typing import Optional
+import sys
+from functools import partial
+from typing import Iterator, Optional
 
 from opengov_oscal_pycore.models import Control, Group
-from opengov_oscal_pycore.crud.parts import parts_ref, find_part, _get
 
-from ..dto.common import TextItem
+from ._parallel import map_controls
+from ..dto.common import TEXT_ITEM_LIST_ADAPTER
 from ..dto.ropa import (
     RopaControlSummary, RopaControlDetail,
     RopaGroupSummary, RopaGroupDetail,
@@ -19,21 +21,10 @@ from ..dto.ropa import (
 from ..domain.privacy_control import (
     extract_legal_articles, extract_evidence_artifacts,
     extract_maturity_domain, extract_maturity_requirement,
-    extract_measure_category, extract_statement,
-    extract_maturity_level_texts, list_dp_goals,
-    list_typical_measures, list_assessment_questions,
+    extract_bundle, _intern,
 )
 
 
-def _extract_maturity_hints_prose(control: Control) -> Optional[str]:
-    """Return the maturity-hints container prose, or None."""
-    parts = parts_ref(control)
-    part = find_part(parts, name="maturity-hints")
-    if part is None:
-        return None
-    return _get(part, "prose")
-
-
 def control_to_ropa_summary(
     control: Control,
     *,
@@ -43,7 +34,7 @@ def control_to_ropa_summary(
     return RopaControlSummary(
         id=control.id,
         title=control.title or "",
-        group_id=group_id,
+        group_id=_intern(group_id),
         legal_articles=extract_legal_articles(control),
         evidence_artifacts=extract_evidence_artifacts(control),
         maturity_domain=extract_maturity_domain(control),
@@ -57,32 +48,26 @@ def control_to_ropa_detail(
     group_id: Optional[str] = None,
 ) -> RopaControlDetail:
     """Convert a Control to a RopaControlDetail DTO."""
-    maturity = extract_maturity_level_texts(control)
+    b = extract_bundle(control)
 
     return RopaControlDetail(
         id=control.id,
-        ctrl_class=control.class_ or "",
+        ctrl_class=sys.intern(control.class_ or ""),
         title=control.title or "",
-        group_id=group_id,
-        legal_articles=extract_legal_articles(control),
-        evidence_artifacts=extract_evidence_artifacts(control),
-        maturity_domain=extract_maturity_domain(control),
-        maturity_requirement=extract_maturity_requirement(control),
-        dp_goals=list_dp_goals(control),
-        statement=extract_statement(control),
-        maturity_hints=_extract_maturity_hints_prose(control),
-        maturity_level_1=maturity.get(1),
-        maturity_level_3=maturity.get(3),
-        maturity_level_5=maturity.get(5),
-        typical_measures=[
-            TextItem(id=m["id"], prose=m["prose"])
-            for m in list_typical_measures(control)
-        ],
-        assessment_questions=[
-            TextItem(id=q["id"], prose=q["prose"])
-            for q in list_assessment_questions(control)
-        ],
-        measure_category=extract_measure_category(control),
+        group_id=_intern(group_id),
+        legal_articles=b.legal_articles,
+        evidence_artifacts=b.evidence_artifacts,
+        maturity_domain=b.maturity_domain,
+        maturity_requirement=b.maturity_requirement,
+        dp_goals=b.dp_goals,
+        statement=b.statement,
+        maturity_hints=b.maturity_hints,
+        maturity_level_1=b.maturity_level_1,
+        maturity_level_3=b.maturity_level_3,
+        maturity_level_5=b.maturity_level_5,
+        typical_measures=TEXT_ITEM_LIST_ADAPTER.validate_python(b.typical_measures),
+        assessment_questions=TEXT_ITEM_LIST_ADAPTER.validate_python(b.assessment_questions),
+        measure_category=b.measure_category,
     )
 
 
@@ -95,6 +80,16 @@ def group_to_ropa_summary(group: Group) -> RopaGroupSummary:
     )
 
 
+def iter_ropa_control_summaries(group: Group) -> Iterator[RopaControlSummary]:
+    """Yield the group's control summaries one at a time.
+
+    Streaming alternative to ``group_to_ropa_detail(group).controls`` for
+    callers that encode or forward controls without keeping the full list.
+    """
+    for c in group.controls:
+        yield control_to_ropa_summary(c, group_id=group.id)
+
+
 def group_to_ropa_detail(
     group: Group,
     *,
@@ -103,10 +98,8 @@ def group_to_ropa_detail(
     """Convert a Group to a RopaGroupDetail DTO."""
     controls = []
     if include_controls:
-        controls = [
-            control_to_ropa_summary(c, group_id=group.id)
-            for c in group.controls
-        ]
+        to_summary = partial(control_to_ropa_summary, group_id=group.id)
+        controls = map_controls(to_summary, group.controls)
     return RopaGroupDetail(
         id=group.id,
         title=group.title or "",
@@ -6,6 +6,7 @@ SDM Catalog Converter (#15).
 Compose domain extract functions into SDM DTOs.
 """
 
+from functools import partial
 from typing import Optional
 
 from opengov_oscal_pycore.models import Control, Group
@@ -15,10 +16,7 @@ from ..dto.sdm import (
     SdmControlDetail, SdmControlDetailProps,
     SdmGroupSummary, SdmGroupDetail,
 )
-from ..domain.sdm_catalog import (
-    extract_sdm_module, extract_sdm_goals, extract_dsgvo_articles,
-    extract_implementation_level, extract_dp_risk_impact, extract_related_mappings,
-)
+from ..domain.sdm_catalog import extract_sdm_bundle
 
 
 def control_to_sdm_summary(
@@ -27,14 +25,15 @@ def control_to_sdm_summary(
     group_id: Optional[str] = None,
 ) -> SdmControlSummary:
     """Convert a Control to an SdmControlSummary DTO."""
+    b = extract_sdm_bundle(control)
     return SdmControlSummary(
         id=control.id,
         title=control.title or "",
         group_id=group_id,
         props=SdmControlSummaryProps(
-            sdm_module=extract_sdm_module(control),
-            sdm_goals=extract_sdm_goals(control),
-            dsgvo_articles=extract_dsgvo_articles(control),
+            sdm_module=b.sdm_module,
+            sdm_goals=b.sdm_goals,
+            dsgvo_articles=b.dsgvo_articles,
         ),
     )
 
@@ -45,18 +44,19 @@ def control_to_sdm_detail(
     group_id: Optional[str] = None,
 ) -> SdmControlDetail:
     """Convert a Control to an SdmControlDetail DTO."""
+    b = extract_sdm_bundle(control)
     return SdmControlDetail(
         id=control.id,
         title=control.title or "",
         class_=control.class_,
         group_id=group_id,
         props=SdmControlDetailProps(
-            sdm_module=extract_sdm_module(control),
-            sdm_goals=extract_sdm_goals(control),
-            dsgvo_articles=extract_dsgvo_articles(control),
-            implementation_level=extract_implementation_level(control),
-            dp_risk_impact=extract_dp_risk_impact(control),
-            related_mappings=extract_related_mappings(control),
+            sdm_module=b.sdm_module,
+            sdm_goals=b.sdm_goals,
+            dsgvo_articles=b.dsgvo_articles,
+            implementation_level=b.implementation_level,
+            dp_risk_impact=b.dp_risk_impact,
+            related_mappings=b.related_mappings,
         ),
     )
 
@@ -72,12 +72,10 @@ def group_to_sdm_summary(group: Group) -> SdmGroupSummary:
 
 def group_to_sdm_detail(group: Group) -> SdmGroupDetail:
     """Convert a Group to an SdmGroupDetail DTO with all controls."""
+    to_detail = partial(control_to_sdm_detail, group_id=group.id)
     return SdmGroupDetail(
         id=group.id,
         title=group.title or "",
         control_count=len(group.controls),
-        controls=[
-            control_to_sdm_detail(ctrl, group_id=group.id)
-            for ctrl in group.controls
-        ],
+        controls=list(map(to_detail, group.controls)),
     )
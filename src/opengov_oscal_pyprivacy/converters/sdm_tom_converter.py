@@ -9,31 +9,31 @@ Compose domain extract functions into SDM-TOM DTOs (summary and detail).
 from opengov_oscal_pycore.models import Control
 
 from ..dto.sdm_tom import SdmTomControlSummary, SdmTomControlDetail
-from ..domain.sdm_catalog import (
-    extract_sdm_module, extract_sdm_goals, extract_dsgvo_articles,
-    extract_sdm_tom_description, extract_sdm_tom_implementation_hints,
-)
+from ..domain.sdm_catalog import extract_sdm_bundle, extract_sdm_tom_prose_map
 
 
 def control_to_sdm_tom_summary(control: Control) -> SdmTomControlSummary:
     """Convert a Control to an SdmTomControlSummary DTO."""
+    b = extract_sdm_bundle(control)
     return SdmTomControlSummary(
         id=control.id,
         title=control.title or "",
-        sdm_module=extract_sdm_module(control),
-        sdm_goals=extract_sdm_goals(control),
-        dsgvo_articles=extract_dsgvo_articles(control),
+        sdm_module=b.sdm_module,
+        sdm_goals=b.sdm_goals,
+        dsgvo_articles=b.dsgvo_articles,
     )
 
 
 def control_to_sdm_tom_detail(control: Control) -> SdmTomControlDetail:
     """Convert a Control to an SdmTomControlDetail DTO."""
+    b = extract_sdm_bundle(control)
+    prose = extract_sdm_tom_prose_map(control)
     return SdmTomControlDetail(
         id=control.id,
         title=control.title or "",
-        sdm_module=extract_sdm_module(control),
-        sdm_goals=extract_sdm_goals(control),
-        dsgvo_articles=extract_dsgvo_articles(control),
-        description=extract_sdm_tom_description(control),
-        implementation_hints=extract_sdm_tom_implementation_hints(control),
+        sdm_module=b.sdm_module,
+        sdm_goals=b.sdm_goals,
+        dsgvo_articles=b.dsgvo_articles,
+        description=prose["description"],
+        implementation_hints=prose["implementation-hints"],
     )
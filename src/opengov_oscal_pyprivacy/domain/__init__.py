@@ -11,6 +11,7 @@ from .privacy_control import (
     set_risk_hint,
     replace_risk_scenarios,
     set_maturity_level_text,
+    set_maturity_levels,
     get_maturity_level_text,
     list_dp_goals,
     replace_dp_goals,
@@ -24,7 +25,10 @@ from .privacy_control import (
     extract_maturity_domain,
     extract_maturity_requirement,
     extract_measure_category,
+    extract_bundle,
+    PrivacyExtractBundle,
 )
+from ._extract import extract_cache
 from .risk_guidance import (
     get_risk_impact_scenarios,
     upsert_risk_impact_scenario,
@@ -37,11 +41,15 @@ from .sdm_catalog import (
     extract_implementation_level,
     extract_dp_risk_impact,
     extract_related_mappings,
+    iter_related_mappings,
+    SdmExtractBundle,
+    extract_sdm_bundle,
     set_implementation_level,
     set_dp_risk_impact,
     replace_related_mappings,
     extract_sdm_tom_description,
     extract_sdm_tom_implementation_hints,
+    extract_sdm_tom_prose_map,
     set_sdm_tom_description,
     set_sdm_tom_implementation_hints,
 )
@@ -51,6 +59,10 @@ from .query import (
     find_controls_by_legal_article,
     find_controls_by_evidence,
     find_controls_by_maturity_domain,
+    find_control_by_id,
+    PropIndex,
+    build_prop_index,
+    query_cache,
 )
 from .resilience_catalog import (
     extract_domain,
@@ -68,6 +80,7 @@ from .profile import (
 from .ssp import (
     generate_implemented_requirements,
     attach_evidence_to_ssp,
+    index_implemented_requirements,
     get_import_profile_href,
 )
 from .mapping import (
@@ -77,4 +90,6 @@ from .mapping import (
     delete_mapping,
     calculate_mapping_coverage,
     resolve_transitive_mappings,
+    MappingIndex,
+    CatalogLayout,
 )
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+"""
+Shared internals of the domain extract helpers.
+
+Scoped memoization (:class:`ScopedMemo`, :func:`extract_cache`), part prose
+access and the data-protection goal prop test, used by the privacy, SDM and
+resilience modules alike. :mod:`.query` reuses :class:`ScopedMemo` for its
+catalog indexes.
+"""
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Hashable,
+    Iterator,
+    Optional,
+    ParamSpec,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from opengov_oscal_pycore.models import Control, Property
+
+from .. import catalog_keys as K
+
+
+_T = TypeVar("_T")
+_V = TypeVar("_V")
+_P = ParamSpec("_P")
+
+
+class ScopedMemo(Generic[_V]):
+    """A memo dict that only exists inside :meth:`scope`.
+
+    It lives in a :class:`~contextvars.ContextVar`, so each thread and asyncio
+    task sees its own scope (or none). :attr:`current` returns the open memo
+    or ``None``; it is the bound ``ContextVar.get`` so the per-call lookup
+    stays in C. Entries map a key derived from ``id(obj)`` to ``(obj, value)``:
+    holding *obj* keeps its id from being reused while the scope is open.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._var: ContextVar[Optional[Dict[Hashable, Tuple[object, _V]]]] = ContextVar(
+            name, default=None
+        )
+        self.current = self._var.get
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Open a memo for the ``with`` block; nested blocks share the outermost."""
+        if self._var.get() is not None:
+            yield
+            return
+        token = self._var.set({})
+        try:
+            yield
+        finally:
+            self._var.reset(token)
+
+
+# Keyed on (function, id(control)).
+_EXTRACT_MEMO: ScopedMemo[Any] = ScopedMemo("_EXTRACT_MEMO")
+
+
+@contextmanager
+def extract_cache() -> Iterator[None]:
+    """Memoize the read-only extract helpers per control inside the ``with`` block.
+
+    Covers the privacy, SDM and resilience ``extract_*`` readers. Controls are
+    mutable, so nothing is cached outside the block. Do not modify the
+    controls (or the returned lists) while the block is active. Nested blocks
+    share the outermost cache. The cache only applies to the current thread or
+    asyncio task; other threads and tasks keep reading uncached.
+    """
+    with _EXTRACT_MEMO.scope():
+        yield
+
+
+def memoized(fn: Callable[_P, _T]) -> Callable[_P, _T]:
+    """Memoize *fn* per control inside :func:`extract_cache`.
+
+    Only plain ``fn(control)`` calls are memoized; calls with further
+    arguments are passed through.
+    """
+    get_memo = _EXTRACT_MEMO.current
+
+    @functools.wraps(fn)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+        memo = get_memo()
+        if memo is None or kwargs or len(args) != 1:
+            return fn(*args, **kwargs)
+        control = args[0]
+        key = (fn, id(control))
+        hit = memo.get(key)
+        if hit is not None:
+            return cast(_T, hit[1])
+        result = fn(*args, **kwargs)
+        memo[key] = (control, result)
+        return result
+
+    return wrapper
+
+
+_MISS = object()
+
+
+def part_prose(part: Any) -> Optional[str]:
+    """Return the prose of a Part model or part dict (``None`` for no part)."""
+    # Part models are the common case; try the attribute before the dict path.
+    prose = getattr(part, "prose", _MISS)
+    if prose is not _MISS:
+        return cast(Optional[str], prose)
+    return cast(Optional[str], part.get("prose")) if isinstance(part, dict) else None
+
+
+# compat: assurance_goal|assurnace_goal
+DP_GOAL_NAMES = frozenset({"assurance_goal", "assurnace_goal"})
+
+
+def is_dp_goal(
+    p: Property,
+    _names: FrozenSet[str] = DP_GOAL_NAMES,
+    _cls: str = K.CLASS_TELEOLOGICAL,
+    _grp: str = K.GROUP_AIM,
+) -> bool:
+    # The defaults bind the constants as locals for the per-prop test.
+    return p.name in _names and p.class_ == _cls and getattr(p, "group", None) == _grp
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from itertools import filterfalse, groupby
+from operator import countOf
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, cast
 
 from opengov_oscal_pycore.models import Catalog
 from opengov_oscal_pycore.crud_catalog import iter_controls, iter_controls_with_group
@@ -8,90 +12,224 @@ from ..dto.mapping_workbench import SdmSecurityMapping, MappingStandards
 from ..dto.mapping_coverage import MappingCoverageResult, TransitiveMappingPath
 
 
+def _mapping_id(m: Dict[str, Any]) -> str:
+    """Return the SDM control ID of a raw mapping dict (camelCase or snake_case key)."""
+    return cast(str, m.get("sdmControlId") or m.get("sdm_control_id", ""))
+
+
+def _first_positions(ids: List[str]) -> Dict[str, int]:
+    by_id: Dict[str, int] = {}
+    for i, mid in enumerate(ids):
+        by_id.setdefault(mid, i)
+    return by_id
+
+
+@dataclass
+class MappingIndex:
+    """Position index of a raw mapping list by SDM control ID.
+
+    Built in one pass over ``data``; the first entry per ID wins, matching the
+    linear lookups. ``ids`` holds the normalized ID of every entry, so the
+    camelCase/snake_case fallback is evaluated once per entry.
+    :meth:`lookup_last` answers with the last entry per ID instead, which is
+    what :func:`resolve_transitive_mappings` has always used. Pass it as
+    ``index=`` together with the same list to the helpers below; the CRUD
+    helpers keep it in sync when they modify the list. Appending, removing or
+    editing entries of the list directly bypasses them and leaves the index
+    stale.
+    """
+
+    data: List[Dict[str, Any]]
+    by_id: Dict[str, int] = field(default_factory=dict)
+    ids: List[str] = field(default_factory=list)
+    _mapped_ids: Optional[FrozenSet[str]] = field(default=None, repr=False, compare=False)
+    _last_by_id: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def build(cls, mapping_data: List[Dict[str, Any]]) -> "MappingIndex":
+        ids = [_mapping_id(m) for m in mapping_data]
+        return cls(mapping_data, _first_positions(ids), ids)
+
+    def lookup(self, sdm_control_id: str) -> Optional[Dict[str, Any]]:
+        """Return the raw mapping dict for *sdm_control_id*, or None."""
+        i = self.by_id.get(sdm_control_id)
+        return self.data[i] if i is not None else None
+
+    def lookup_last(self, sdm_control_id: str) -> Optional[Dict[str, Any]]:
+        """Return the last raw mapping dict for *sdm_control_id*, or None."""
+        if self._last_by_id is None:
+            self._last_by_id = {mid: i for i, mid in enumerate(self.ids)}
+        i = self._last_by_id.get(sdm_control_id)
+        return self.data[i] if i is not None else None
+
+    def mapped_ids(self) -> FrozenSet[str]:
+        """IDs of the entries with content, computed once until the list changes."""
+        if self._mapped_ids is None:
+            self._mapped_ids = frozenset(
+                mid for mid, m in zip(self.ids, self.data) if _has_content(m)
+            )
+        return self._mapped_ids
+
+
+def _position(
+    mapping_data: List[Dict[str, Any]],
+    sdm_control_id: str,
+    index: Optional[MappingIndex],
+) -> Optional[int]:
+    if index is not None:
+        return index.by_id.get(sdm_control_id)
+    for i, m in enumerate(mapping_data):
+        if _mapping_id(m) == sdm_control_id:
+            return i
+    return None
+
+
 def list_mappings(mapping_data: List[Dict[str, Any]]) -> List[SdmSecurityMapping]:
     """Parse raw mapping dicts into typed SdmSecurityMapping objects."""
     return [SdmSecurityMapping.model_validate(m) for m in mapping_data]
 
 
 def get_mapping(
-    mapping_data: List[Dict[str, Any]], sdm_control_id: str
+    mapping_data: List[Dict[str, Any]],
+    sdm_control_id: str,
+    *,
+    index: Optional[MappingIndex] = None,
 ) -> Optional[SdmSecurityMapping]:
-    """Find a mapping by SDM control ID. Returns None if not found."""
-    for m in mapping_data:
-        mid = m.get("sdmControlId") or m.get("sdm_control_id", "")
-        if mid == sdm_control_id:
-            return SdmSecurityMapping.model_validate(m)
-    return None
+    """Find a mapping by SDM control ID. Returns None if not found.
+
+    With *index* the lookup is a dict hit instead of a scan of *mapping_data*.
+    """
+    i = _position(mapping_data, sdm_control_id, index)
+    return SdmSecurityMapping.model_validate(mapping_data[i]) if i is not None else None
 
 
 def upsert_mapping(
-    mapping_data: List[Dict[str, Any]], mapping: SdmSecurityMapping
+    mapping_data: List[Dict[str, Any]],
+    mapping: SdmSecurityMapping,
+    *,
+    index: Optional[MappingIndex] = None,
 ) -> SdmSecurityMapping:
-    """Insert or update a mapping. Returns the upserted mapping."""
+    """Insert or update a mapping. Returns the upserted mapping.
+
+    An existing entry that already equals the dumped mapping is left in place,
+    so idempotent writes keep the stored dict object.
+    """
     dumped = mapping.model_dump(by_alias=True)
-    for i, m in enumerate(mapping_data):
-        mid = m.get("sdmControlId") or m.get("sdm_control_id", "")
-        if mid == mapping.sdm_control_id:
+    i = _position(mapping_data, mapping.sdm_control_id, index)
+    if i is not None:
+        if mapping_data[i] != dumped:
             mapping_data[i] = dumped
-            return mapping
+            if index is not None:
+                index._mapped_ids = None
+        return mapping
     mapping_data.append(dumped)
+    if index is not None:
+        index.by_id[mapping.sdm_control_id] = len(mapping_data) - 1
+        index.ids.append(mapping.sdm_control_id)
+        index._mapped_ids = None
+        index._last_by_id = None
     return mapping
 
 
 def delete_mapping(
-    mapping_data: List[Dict[str, Any]], sdm_control_id: str
+    mapping_data: List[Dict[str, Any]],
+    sdm_control_id: str,
+    *,
+    index: Optional[MappingIndex] = None,
 ) -> None:
     """Remove a mapping by SDM control ID. No-op if not found."""
-    for i, m in enumerate(mapping_data):
-        mid = m.get("sdmControlId") or m.get("sdm_control_id", "")
-        if mid == sdm_control_id:
-            mapping_data.pop(i)
-            return
+    i = _position(mapping_data, sdm_control_id, index)
+    if i is None:
+        return
+    mapping_data.pop(i)
+    if index is not None:
+        # The list order is what gets persisted, so entries are not swapped
+        # with the tail; the positions behind *i* shift and are re-indexed.
+        index.ids.pop(i)
+        index.by_id = _first_positions(index.ids)
+        index._mapped_ids = None
+        index._last_by_id = None
+
+
+def _has_content(m: Dict[str, Any]) -> bool:
+    """True if a raw mapping has a security control or a non-empty standard."""
+    if m.get("securityControls") or m.get("security_controls"):
+        return True
+    standards = m.get("standards") or {}
+    return bool(
+        standards.get("bsi") or standards.get("iso27001") or standards.get("iso27701")
+    )
+
+
+def _group_id(pair: Tuple[Any, Any]) -> str:
+    group = pair[1]
+    return group.id if group else "__ungrouped__"
+
+
+@dataclass(frozen=True)
+class CatalogLayout:
+    """Control IDs of a catalog as consecutive ``(group_id, control_ids)`` runs.
+
+    Coverage only depends on this structure, so a service that checks many
+    mapping sets against one catalog can build it once and pass it as
+    ``layout=``. Only IDs and grouping are stored, so edits inside controls
+    never affect it; adding, removing, renaming or moving controls does.
+    """
+
+    groups: Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+    @classmethod
+    def build(cls, cat: Catalog) -> "CatalogLayout":
+        return cls(tuple(
+            (gid, tuple(ctrl.id for ctrl, _ in pairs))
+            for gid, pairs in groupby(iter_controls_with_group(cat), key=_group_id)
+        ))
 
 
 def calculate_mapping_coverage(
     source_catalog: Catalog,
     mapping_data: List[Dict[str, Any]],
+    *,
+    index: Optional[MappingIndex] = None,
+    layout: Optional[CatalogLayout] = None,
 ) -> MappingCoverageResult:
     """Calculate how many catalog controls are covered by mappings.
 
     A control is "mapped" if there exists a mapping entry with its control ID
     as the sdmControlId AND that entry has at least one security_control or
     at least one non-empty standard (bsi, iso27001, or iso27701).
+    A prebuilt *index* over *mapping_data* supplies the mapped IDs, so
+    analysing several catalogs against the same mappings checks them once.
+    A prebuilt *layout* of *source_catalog* skips the walk over its controls.
     """
-    # Collect all control IDs with their group
-    controls_by_group: Dict[str, List[str]] = {}
-    all_control_ids: List[str] = []
-
-    for ctrl, group in iter_controls_with_group(source_catalog):
-        gid = group.id if group else "__ungrouped__"
-        controls_by_group.setdefault(gid, []).append(ctrl.id)
-        all_control_ids.append(ctrl.id)
-
-    # Build set of mapped control IDs
-    mapped_ids = set()
-    for m in mapping_data:
-        mid = m.get("sdmControlId") or m.get("sdm_control_id", "")
-        # Check if mapping has actual content
-        has_security = bool(m.get("securityControls") or m.get("security_controls"))
-        standards = m.get("standards", {})
-        has_standards = bool(
-            standards.get("bsi") or standards.get("iso27001") or standards.get("iso27701")
-        )
-        if has_security or has_standards:
-            mapped_ids.add(mid)
-
-    total = len(all_control_ids)
-    mapped = len([cid for cid in all_control_ids if cid in mapped_ids])
-    unmapped = [cid for cid in all_control_ids if cid not in mapped_ids]
-    coverage_pct = round((mapped / total * 100) if total > 0 else 0.0, 1)
+    if index is not None:
+        mapped_ids = index.mapped_ids()
+    else:
+        mapped_ids = frozenset(_mapping_id(m) for m in mapping_data if _has_content(m))
 
-    # Per-group coverage
-    per_group: Dict[str, float] = {}
-    for gid, cids in controls_by_group.items():
-        g_total = len(cids)
-        g_mapped = len([c for c in cids if c in mapped_ids])
-        per_group[gid] = round((g_mapped / g_total * 100) if g_total > 0 else 0.0, 1)
+    if layout is None:
+        layout = CatalogLayout.build(source_catalog)
+
+    # One pass over the controls, group by group; the membership tests run
+    # in C via map/countOf and filterfalse.
+    contains = mapped_ids.__contains__
+    total = 0
+    mapped = 0
+    unmapped: List[str] = []
+    g_totals: Dict[str, int] = defaultdict(int)
+    g_mapped: Dict[str, int] = defaultdict(int)
+    for gid, cids in layout.groups:
+        n_mapped = countOf(map(contains, cids), True)
+        total += len(cids)
+        mapped += n_mapped
+        unmapped.extend(filterfalse(contains, cids))
+        g_totals[gid] += len(cids)
+        g_mapped[gid] += n_mapped
+
+    coverage_pct = round((mapped / total * 100) if total > 0 else 0.0, 1)
+    per_group: Dict[str, float] = {
+        gid: round(g_mapped[gid] / g_total * 100, 1) for gid, g_total in g_totals.items()
+    }
 
     return MappingCoverageResult(
         total_controls=total,
@@ -102,42 +240,73 @@ def calculate_mapping_coverage(
     )
 
 
+def _standards_list(m: Optional[Dict[str, Any]]) -> List[str]:
+    out: List[str] = []
+    if m:
+        standards = m.get("standards", {})
+        for std_name, std_vals in standards.items():
+            if std_vals:
+                out.extend(f"{std_name}:{v}" for v in std_vals)
+    return out
+
+
 def resolve_transitive_mappings(
     mappings: List[Dict[str, Any]],
     source_id: str,
+    *,
+    index: Optional[MappingIndex] = None,
+    max_depth: Optional[int] = 1,
 ) -> List[TransitiveMappingPath]:
     """Find transitive mapping paths from a source control.
 
     A transitive path: source -> security_controls -> their mappings -> ...
     This follows security_control references to find indirect standard mappings.
+    With duplicate IDs the last entry is used. A prebuilt *index* over
+    *mappings* is reused instead of building a lookup.
+
+    By default only the direct references of the source are followed. With a
+    larger *max_depth* (``None`` for the full closure) the references are
+    walked breadth-first: every reached mapping is expanded once, so cycles
+    terminate and each edge yields one path, in the order it is found.
+    Raises ``ValueError`` if *max_depth* is below 1.
     """
-    # Build lookup: controlId -> mapping
-    by_id: Dict[str, Dict[str, Any]] = {}
-    for m in mappings:
-        mid = m.get("sdmControlId") or m.get("sdm_control_id", "")
-        by_id[mid] = m
+    if max_depth is not None and max_depth < 1:
+        raise ValueError(f"max_depth must be >= 1 or None, got {max_depth}")
+    lookup: Callable[[str], Optional[Dict[str, Any]]]
+    if index is not None:
+        lookup = index.lookup_last
+    else:
+        # Build lookup: controlId -> mapping
+        lookup = {_mapping_id(m): m for m in mappings}.get
 
     paths: List[TransitiveMappingPath] = []
-    source = by_id.get(source_id)
+    source = lookup(source_id)
     if not source:
         return paths
 
-    # Get direct security control refs
-    sec_controls = source.get("securityControls") or source.get("security_controls", [])
-    for ref in sec_controls:
-        ctrl_id = ref.get("controlId") or ref.get("control_id", "")
-        target = by_id.get(ctrl_id)
-        target_standards: List[str] = []
-        if target:
-            standards = target.get("standards", {})
-            for std_name, std_vals in standards.items():
-                if std_vals:
-                    target_standards.extend(f"{std_name}:{v}" for v in std_vals)
-
-        paths.append(TransitiveMappingPath(
-            source_id=source_id,
-            path=[source_id, ctrl_id],
-            target_standards=target_standards,
-        ))
+    # target_standards per control ID, computed once per node
+    standards_by_id: Dict[str, List[str]] = {}
+    visited = {source_id}
+    queue = deque([(source, [source_id])])
+    while queue:
+        node, node_path = queue.popleft()
+        sec_controls = node.get("securityControls") or node.get("security_controls", [])
+        expand = max_depth is None or len(node_path) < max_depth
+        for ref in sec_controls:
+            ctrl_id = ref.get("controlId") or ref.get("control_id", "")
+            target = lookup(ctrl_id)
+            target_standards = standards_by_id.get(ctrl_id)
+            if target_standards is None:
+                target_standards = standards_by_id[ctrl_id] = _standards_list(target)
+            path = node_path + [ctrl_id]
+
+            paths.append(TransitiveMappingPath(
+                source_id=source_id,
+                path=path,
+                target_standards=list(target_standards),
+            ))
+            if expand and target and ctrl_id not in visited:
+                visited.add(ctrl_id)
+                queue.append((target, path))
 
     return paths
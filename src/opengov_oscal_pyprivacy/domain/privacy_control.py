@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import csv
+import io
+import sys
 from dataclasses import dataclass
 from importlib.resources import files
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 from opengov_oscal_pycore.models import Control, Property
 from opengov_oscal_pycore.crud.parts import (
     parts_ref,
     find_part,
+    parts_by_name,
     ensure_part_container,
     list_child_parts,
     add_child_part,
@@ -20,6 +23,7 @@ from opengov_oscal_pycore.crud.parts import (
 from opengov_oscal_pycore.crud.props import find_props, remove_props, upsert_prop, get_prop
 
 from .. import catalog_keys as K
+from ._extract import DP_GOAL_NAMES, extract_cache, is_dp_goal, memoized, part_prose
 
 from .risk_guidance import (
     get_risk_impact_scenarios,
@@ -32,7 +36,7 @@ from .risk_guidance import (
 class PartSet:
     container_name: str
     canonical_item_name: str
-    accepted_item_names: Tuple[str, ...]
+    accepted_item_names: FrozenSet[str]
     id_prefix: str
 
 
@@ -45,28 +49,35 @@ def load_part_sets() -> Dict[str, PartSet]:
         return _PART_SETS_CACHE
 
     path = files("opengov_oscal_pyprivacy").joinpath("data/privacy_part_sets.csv")
-    content = path.read_text(encoding="utf-8")
-    rows = list(csv.DictReader(content.splitlines()))
-    out: Dict[str, PartSet] = {}
-    for r in rows:
-        out[r["container_name"]] = PartSet(
-            container_name=r["container_name"],
-            canonical_item_name=r["canonical_item_name"],
-            accepted_item_names=tuple((r["accepted_item_names"] or "").split("|")),
-            id_prefix=r["id_prefix"],
-        )
+    with io.TextIOWrapper(path.open("rb"), encoding="utf-8", newline="") as fh:
+        out: Dict[str, PartSet] = {}
+        for r in csv.DictReader(fh):
+            accepted = r["accepted_item_names"]
+            out[r["container_name"]] = PartSet(
+                container_name=r["container_name"],
+                canonical_item_name=r["canonical_item_name"],
+                accepted_item_names=frozenset(accepted.split("|")) if accepted else frozenset(),
+                id_prefix=r["id_prefix"],
+            )
     _PART_SETS_CACHE = out
     return out
 
 
-def _next_seq_id(existing_ids: Sequence[str], prefix: str) -> str:
-    nums: List[int] = []
-    for eid in existing_ids:
-        if isinstance(eid, str) and eid.startswith(prefix):
-            tail = eid[len(prefix):]
-            if tail.isdigit():
-                nums.append(int(tail))
-    nxt = (max(nums) + 1) if nums else 1
+def _part_set(container_name: str) -> PartSet:
+    # Hot CRUD path: index the cache directly once it is populated.
+    return (_PART_SETS_CACHE or load_part_sets())[container_name]
+
+
+def _next_seq_id(existing_ids: Iterable[str], prefix: str) -> str:
+    plen = len(prefix)
+    nxt = 1 + max(
+        (
+            int(eid[plen:])
+            for eid in existing_ids
+            if isinstance(eid, str) and eid.startswith(prefix) and eid[plen:].isdigit()
+        ),
+        default=0,
+    )
     return f"{prefix}{nxt:03d}"
 
 
@@ -74,30 +85,31 @@ def _next_seq_id(existing_ids: Sequence[str], prefix: str) -> str:
 # Generic item-container CRUD
 # -----------------------------
 
-def _list_items(control: Control, container_name: str) -> List[Dict[str, str]]:
-    part_sets = load_part_sets()
-    cfg = part_sets[container_name]
-    container = ensure_part_container(control, container_name)
+def _collect_items(container: Any, accepted_item_names: FrozenSet[str]) -> List[Dict[str, str]]:
     out: List[Dict[str, str]] = []
     for item in list_child_parts(container):
-        if _get(item, "name") in cfg.accepted_item_names:
+        if _get(item, "name") in accepted_item_names:
             out.append({"id": _get(item, "id", ""), "prose": _get(item, "prose", "")})
     return out
 
 
+def _list_items(control: Control, container_name: str) -> List[Dict[str, str]]:
+    cfg = _part_set(container_name)
+    container = ensure_part_container(control, container_name)
+    return _collect_items(container, cfg.accepted_item_names)
+
+
 def _add_item(control: Control, container_name: str, prose: str) -> str:
-    part_sets = load_part_sets()
-    cfg = part_sets[container_name]
+    cfg = _part_set(container_name)
     container = ensure_part_container(control, container_name, part_id=f"{control.id.lower()}-{container_name}")
-    existing_ids = [_get(p, "id", "") for p in list_child_parts(container) if isinstance(_get(p, "id", ""), str)]
+    existing_ids = (_get(p, "id", "") for p in list_child_parts(container))
     new_id = _next_seq_id(existing_ids, f"{control.id.lower()}-{cfg.id_prefix}-")
     add_child_part(container, name=cfg.canonical_item_name, part_id=new_id, prose=prose)
     return new_id
 
 
 def _update_item(control: Control, container_name: str, item_id: str, prose: str) -> None:
-    part_sets = load_part_sets()
-    cfg = part_sets[container_name]
+    cfg = _part_set(container_name)
     container = ensure_part_container(control, container_name)
     # allow update independent of name (only id), but enforce canonical name on write
     updated = update_child_part(container, item_id, prose=prose)
@@ -166,23 +178,15 @@ def replace_risk_scenarios(control: Control, scenarios: List[Dict[str, str]]) ->
         )
 
 
-def set_maturity_level_text(control: Control, level: int, prose: str) -> None:
-    if level not in (1, 3, 5):
-        raise ValueError("level must be one of 1, 3, 5")
-
-    mh = ensure_part_container(control, "maturity-hints", part_id=f"{control.id.lower()}-maturity")
-    # ensure children list
-    children = _get(mh, "parts", [])
+def _set_maturity_child(
+    mh: Any, children: List[Any], children_by_name: Dict[Any, Any], level: int, prose: str
+) -> None:
     name = f"maturity-level-{level}"
-    # find by name
-    child = None
-    for p in children:
-        if _get(p, "name") == name:
-            child = p
-            break
+    child = children_by_name.get(name)
     if child is None:
         child = {"id": f"{_get(mh, 'id', 'maturity')}-level-{level:02d}", "name": name, "props": []}
         children.append(child)
+        children_by_name[name] = child
     _set(child, "prose", prose)
 
     # ensure maturity-level prop (as in GOV-01)
@@ -190,10 +194,77 @@ def set_maturity_level_text(control: Control, level: int, prose: str) -> None:
     if not isinstance(props, list):
         props = []
         _set(child, "props", props)
-    # remove wrong legacy prop name (maturity-level-<n>)
-    props[:] = [pr for pr in props if not (_get(pr, "name") == f"maturity-level-{level}")]
-    if not any(_get(pr, "name") == "maturity-level" and _get(pr, "value") == str(level) for pr in props):
-        props.append({"name": "maturity-level", "value": str(level)})
+    # remove wrong legacy prop name (maturity-level-<n>) and look for the
+    # canonical prop in the same pass
+    value = str(level)
+    kept: List[Any] = []
+    has_level_prop = False
+    for pr in props:
+        pr_name = _get(pr, "name")
+        if pr_name == name:
+            continue
+        if pr_name == "maturity-level" and _get(pr, "value") == value:
+            has_level_prop = True
+        kept.append(pr)
+    if not has_level_prop:
+        kept.append({"name": "maturity-level", "value": value})
+    props[:] = kept
+
+
+def set_maturity_level_text(control: Control, level: int, prose: str) -> None:
+    if level not in (1, 3, 5):
+        raise ValueError("level must be one of 1, 3, 5")
+
+    mh = ensure_part_container(control, "maturity-hints", part_id=f"{control.id.lower()}-maturity")
+    # ensure children list
+    children = _get(mh, "parts", [])
+    # first child per name, as the previous linear search found it
+    children_by_name: Dict[Any, Any] = {}
+    for p in children:
+        children_by_name.setdefault(_get(p, "name"), p)
+    _set_maturity_child(mh, children, children_by_name, level, prose)
+
+
+def set_maturity_levels(control: Control, texts: Mapping[int, str]) -> None:
+    """Set several maturity level texts at once, e.g. ``{1: ..., 3: ..., 5: ...}``.
+
+    Equivalent to calling :func:`set_maturity_level_text` per level, but the
+    maturity-hints children are indexed only once. All levels are validated
+    before anything is written.
+    """
+    if any(level not in (1, 3, 5) for level in texts):
+        raise ValueError("level must be one of 1, 3, 5")
+
+    mh = ensure_part_container(control, "maturity-hints", part_id=f"{control.id.lower()}-maturity")
+    children = _get(mh, "parts", [])
+    children_by_name: Dict[Any, Any] = {}
+    for p in children:
+        children_by_name.setdefault(_get(p, "name"), p)
+    for level, prose in texts.items():
+        _set_maturity_child(mh, children, children_by_name, level, prose)
+
+
+_MaturityTexts = Tuple[Optional[str], Optional[str], Optional[str]]
+
+# Child part name -> slot in a (level 1, level 3, level 5) tuple
+_MATURITY_LEVEL_SLOTS: Dict[str, int] = {
+    "maturity-level-1": 0,
+    "maturity-level-3": 1,
+    "maturity-level-5": 2,
+}
+_NO_MATURITY_TEXTS: _MaturityTexts = (None, None, None)
+
+
+def _maturity_level_texts_of(mh: Any) -> _MaturityTexts:
+    """Return (level 1, level 3, level 5) texts of a maturity-hints part (first match wins)."""
+    texts: List[Optional[str]] = [None, None, None]
+    found = [False, False, False]
+    for ch in (_get(mh, "parts") or []):
+        slot = _MATURITY_LEVEL_SLOTS.get(_get(ch, "name"))
+        if slot is not None and not found[slot]:
+            found[slot] = True
+            texts[slot] = _get(ch, "prose")
+    return (texts[0], texts[1], texts[2])
 
 
 def get_maturity_level_text(control: Control, level: int) -> Optional[str]:
@@ -217,16 +288,13 @@ def get_maturity_level_text(control: Control, level: int) -> Optional[str]:
 # Props helpers (privacy)
 # -----------------------------
 
+@memoized
 def list_dp_goals(control: Control) -> List[str]:
-    # compat: assurance_goal|assurnace_goal
-    names = {"assurance_goal", "assurnace_goal"}
-    props = [p for p in control.props if p.name in names and p.class_ == K.CLASS_TELEOLOGICAL and getattr(p, "group", None) == K.GROUP_AIM]
-    return [p.value for p in props]
+    return [sys.intern(p.value) for p in control.props if is_dp_goal(p)]
 
 
 def replace_dp_goals(control: Control, goals: List[str]) -> None:
-    names = {"assurance_goal", "assurnace_goal"}
-    control.props[:] = [p for p in control.props if not (p.name in names and p.class_ == K.CLASS_TELEOLOGICAL and getattr(p, "group", None) == K.GROUP_AIM)]
+    control.props[:] = [p for p in control.props if not is_dp_goal(p)]
     for g in goals:
         upsert_prop(
             control.props,
@@ -246,6 +314,12 @@ def _val(obj: Any, key: str, default: Any = None) -> Any:
     return getattr(obj, key, default)
 
 
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a categorical string so equal values across controls share one object."""
+    return sys.intern(value) if value is not None else None
+
+
+@memoized
 def extract_legal_articles(control: Control) -> List[str]:
     """Return all legal-article values from the control's props.
 
@@ -257,60 +331,70 @@ def extract_legal_articles(control: Control) -> List[str]:
         group=K.GROUP_REFERENCE,
         class_=K.CLASS_PROOF,
     )
-    return [p.value for p in matches]
+    return [sys.intern(p.value) for p in matches]
 
 
+@memoized
 def extract_tom_id(control: Control) -> Optional[str]:
     """Return the SDM building-block identifier, or None."""
     prop = get_prop(control.props, K.SDM_BUILDING_BLOCK)
     return prop.value if prop is not None else None
 
 
-def extract_statement(control: Control) -> Optional[str]:
-    """Return the statement prose from the control's top-level parts, or None."""
-    parts = parts_ref(control)
-    part = find_part(parts, name="statement")
-    if part is None:
-        return None
-    return _get(part, "prose")
+@memoized
+def extract_statement(control: Control, *, parts: Optional[List[Any]] = None) -> Optional[str]:
+    """Return the statement prose from the control's top-level parts, or None.
+
+    Pass *parts* (``parts_ref(control)``) to reuse an already resolved list.
+    """
+    if parts is None:
+        parts = parts_ref(control)
+    return part_prose(find_part(parts, name="statement"))
 
 
-def extract_risk_hint(control: Control) -> Optional[str]:
+@memoized
+def extract_risk_hint(control: Control, *, parts: Optional[List[Any]] = None) -> Optional[str]:
     """Return the risk-hint prose from the control's top-level parts, or None."""
-    parts = parts_ref(control)
-    part = find_part(parts, name="risk-hint")
-    if part is None:
-        return None
-    return _get(part, "prose")
+    if parts is None:
+        parts = parts_ref(control)
+    return part_prose(find_part(parts, name="risk-hint"))
 
 
-def extract_risk_scenarios(control: Control) -> List[Dict[str, str]]:
+@memoized
+def extract_risk_scenarios(control: Control, *, parts: Optional[List[Any]] = None) -> List[Dict[str, str]]:
     """Return risk-scenario children as a list of {title, description} dicts."""
-    parts = parts_ref(control)
+    if parts is None:
+        parts = parts_ref(control)
     container = find_part(parts, name="risk-scenarios")
     if container is None:
         return []
-    children = list_child_parts(container)
+    return _risk_scenarios_of(container)
+
+
+def _risk_scenarios_of(container: Any) -> List[Dict[str, str]]:
     out: List[Dict[str, str]] = []
-    for ch in children:
+    for ch in list_child_parts(container):
         title = _val(ch, "title") or _val(ch, "prose") or ""
         description = _val(ch, "prose") or ""
         out.append({"title": title, "description": description})
     return out
 
 
-def extract_maturity_level_texts(control: Control) -> Dict[int, Optional[str]]:
+@memoized
+def extract_maturity_level_texts(control: Control, *, parts: Optional[List[Any]] = None) -> Dict[int, Optional[str]]:
     """Return maturity-level texts for levels 1, 3, 5."""
-    return {
-        level: get_maturity_level_text(control, level)
-        for level in (1, 3, 5)
-    }
+    if parts is None:
+        parts = parts_ref(control)
+    mh = find_part(parts, name="maturity-hints")
+    lvl1, lvl3, lvl5 = _maturity_level_texts_of(mh) if mh is not None else _NO_MATURITY_TEXTS
+    return {1: lvl1, 3: lvl3, 5: lvl5}
 
 
+@memoized
 def extract_evidence_artifacts(control: Control) -> list[str]:
     """Extract evidence artifact values."""
     return [
-        p.value for p in find_props(
+        sys.intern(p.value) for p in find_props(
             control.props,
             name=K.EVIDENCE,
             group=K.GROUP_VERIFICATION,
@@ -319,12 +403,14 @@ def extract_evidence_artifacts(control: Control) -> list[str]:
     ]
 
 
+@memoized
 def extract_maturity_domain(control: Control) -> Optional[str]:
     """Extract maturity domain value."""
     p = get_prop(control.props, K.MATURITY, group="responsibility", class_=K.CLASS_MATURITY_DOMAIN)
-    return p.value if p else None
+    return _intern(p.value) if p else None
 
 
+@memoized
 def extract_maturity_requirement(control: Control) -> Optional[int]:
     """Extract maturity requirement level as integer."""
     p = get_prop(control.props, K.MATURITY, group="responsibility", class_=K.CLASS_MATURITY_REQUIREMENT)
@@ -336,7 +422,115 @@ def extract_maturity_requirement(control: Control) -> Optional[int]:
         return None
 
 
+@memoized
 def extract_measure_category(control: Control) -> Optional[str]:
     """Extract measure category value."""
     p = get_prop(control.props, K.MEASURE, group=K.GROUP_IMPLEMENTATION, class_=K.CLASS_CATEGORY)
-    return p.value if p else None
+    return _intern(p.value) if p else None
+
+
+# -----------------------------
+# Single-pass extract bundle
+# -----------------------------
+
+@dataclass(frozen=True)
+class PrivacyExtractBundle:
+    """All read-only privacy fields of a control, as gathered by :func:`extract_bundle`."""
+    legal_articles: List[str]
+    evidence_artifacts: List[str]
+    maturity_domain: Optional[str]
+    maturity_requirement: Optional[int]
+    measure_category: Optional[str]
+    tom_id: Optional[str]
+    dp_goals: List[str]
+    statement: Optional[str]
+    risk_hint: Optional[str]
+    maturity_hints: Optional[str]
+    maturity_level_1: Optional[str]
+    maturity_level_3: Optional[str]
+    maturity_level_5: Optional[str]
+    typical_measures: List[Dict[str, str]]
+    assessment_questions: List[Dict[str, str]]
+    risk_scenarios: List[Dict[str, str]]
+
+
+@memoized
+def extract_bundle(control: Control, *, parts: Optional[List[Any]] = None) -> PrivacyExtractBundle:
+    """Gather every privacy field of *control* in one pass over its props and parts.
+
+    Equivalent to calling the individual ``extract_*``/``list_*`` helpers, but
+    without re-scanning ``control.props`` and ``control.parts`` per field.
+    Unlike :func:`list_typical_measures`, missing item containers are not created.
+    Pass *parts* (``parts_ref(control)``) to reuse an already resolved list.
+    """
+    legal_articles: List[str] = []
+    evidence_artifacts: List[str] = []
+    dp_goals: List[str] = []
+    maturity_domain: Optional[Property] = None
+    maturity_requirement: Optional[Property] = None
+    measure_category: Optional[Property] = None
+    tom_id: Optional[Property] = None
+
+    for p in control.props or []:
+        name = p.name
+        group = getattr(p, "group", None)
+        if name == K.LEGAL:
+            if group == K.GROUP_REFERENCE and p.class_ == K.CLASS_PROOF:
+                legal_articles.append(sys.intern(p.value))
+        elif name == K.EVIDENCE:
+            if group == K.GROUP_VERIFICATION and p.class_ == K.CLASS_ARTIFACT:
+                evidence_artifacts.append(sys.intern(p.value))
+        elif name == K.MATURITY:
+            if group == "responsibility":
+                if p.class_ == K.CLASS_MATURITY_DOMAIN and maturity_domain is None:
+                    maturity_domain = p
+                elif p.class_ == K.CLASS_MATURITY_REQUIREMENT and maturity_requirement is None:
+                    maturity_requirement = p
+        elif name == K.MEASURE:
+            if group == K.GROUP_IMPLEMENTATION and p.class_ == K.CLASS_CATEGORY and measure_category is None:
+                measure_category = p
+        elif name in DP_GOAL_NAMES:
+            if p.class_ == K.CLASS_TELEOLOGICAL and group == K.GROUP_AIM:
+                dp_goals.append(sys.intern(p.value))
+        elif name == K.SDM_BUILDING_BLOCK and tom_id is None:
+            tom_id = p
+
+    requirement: Optional[int] = None
+    if maturity_requirement is not None:
+        try:
+            requirement = int(maturity_requirement.value)
+        except (ValueError, TypeError):
+            requirement = None
+
+    by_name = parts_by_name(parts if parts is not None else parts_ref(control))
+
+    mh = by_name.get("maturity-hints")
+    lvl1, lvl3, lvl5 = _maturity_level_texts_of(mh) if mh is not None else _NO_MATURITY_TEXTS
+    measures = by_name.get("typical-measures")
+    questions = by_name.get("assessment-questions")
+    scenarios = by_name.get("risk-scenarios")
+
+    return PrivacyExtractBundle(
+        legal_articles=legal_articles,
+        evidence_artifacts=evidence_artifacts,
+        maturity_domain=_intern(maturity_domain.value) if maturity_domain is not None else None,
+        maturity_requirement=requirement,
+        measure_category=_intern(measure_category.value) if measure_category is not None else None,
+        tom_id=tom_id.value if tom_id is not None else None,
+        dp_goals=dp_goals,
+        statement=part_prose(by_name.get("statement")),
+        risk_hint=part_prose(by_name.get("risk-hint")),
+        maturity_hints=part_prose(mh),
+        maturity_level_1=lvl1,
+        maturity_level_3=lvl3,
+        maturity_level_5=lvl5,
+        typical_measures=(
+            _collect_items(measures, _part_set("typical-measures").accepted_item_names)
+            if measures is not None else []
+        ),
+        assessment_questions=(
+            _collect_items(questions, _part_set("assessment-questions").accepted_item_names)
+            if questions is not None else []
+        ),
+        risk_scenarios=_risk_scenarios_of(scenarios) if scenarios is not None else [],
+    )
@@ -7,8 +7,10 @@ All functions are stateless (except add_profile_import which mutates in place).
 """
 
 import copy
+import functools
 import uuid
-from typing import Callable, List
+from itertools import chain
+from typing import Callable, FrozenSet, List
 
 from opengov_oscal_pycore.models import Catalog, Control, Group, OscalMetadata
 from opengov_oscal_pycore.models_profile import ImportRef, Profile
@@ -21,31 +23,40 @@ from opengov_oscal_pycore.models_profile import ImportRef, Profile
 _NAMESPACE_PROFILE = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
 
 
-def _collect_with_ids(selector_list: List[dict]) -> set[str]:
+def _collect_with_ids(selector_list: List[dict]) -> FrozenSet[str]:
     """Extract control IDs from include-controls / exclude-controls entries.
 
     Each entry is typically ``{"with-ids": ["GOV-01", "GOV-02"]}``.
     """
-    ids: set[str] = set()
-    for entry in selector_list:
-        for cid in entry.get("with-ids", []):
-            ids.add(cid)
-    return ids
+    return frozenset(chain.from_iterable(entry.get("with-ids", ()) for entry in selector_list))
+
+
+def _copy_control(ctrl: Control) -> Control:
+    """Return an independent deep copy of *ctrl*.
+
+    Props and parts appended in place, and mixed-mode dict parts, are kept
+    as they are.
+    """
+    return ctrl.model_copy(deep=True)
 
 
 def _filter_controls(
     controls: List[Control],
-    include_ids: set[str] | None,
-    exclude_ids: set[str],
+    include_ids: FrozenSet[str] | None,
+    exclude_ids: FrozenSet[str],
 ) -> List[Control]:
-    """Return a filtered copy of controls based on include/exclude sets."""
+    """Return a filtered copy of controls based on include/exclude sets.
+
+    *include_ids*, when given, must already have the exclusions removed
+    (see :func:`resolve_profile_imports`); *exclude_ids* is then ignored.
+    """
+    if include_ids is not None:
+        return [_copy_control(c) for c in controls if c.id in include_ids]
     result: List[Control] = []
     for ctrl in controls:
         if exclude_ids and ctrl.id in exclude_ids:
             continue
-        if include_ids is not None and ctrl.id not in include_ids:
-            continue
-        result.append(copy.deepcopy(ctrl))
+        result.append(_copy_control(ctrl))
     return result
 
 
@@ -61,22 +72,32 @@ def resolve_profile_imports(
     """Resolve all imports and return a flat resolved catalog.
 
     For each :class:`ImportRef` in the profile:
-    - Call *catalog_loader(href)* to obtain the source catalog.
+    - Call *catalog_loader(href)* to obtain the source catalog (once per
+      distinct href; imports of the same catalog share the loaded object).
     - Apply ``include-controls`` / ``exclude-controls`` filtering.
     - Collect resulting controls, preserving group structure.
 
     Returns a new :class:`Catalog` with the profile's metadata and a fresh UUID.
     """
     resolved_groups: List[Group] = []
+    # Controls are copied out of the source catalogs, so they are never
+    # mutated and can be shared between imports for the duration of the call.
+    load_catalog = functools.lru_cache(maxsize=None)(catalog_loader)
 
     for imp in profile.imports:
-        source_catalog = catalog_loader(imp.href)
+        source_catalog = load_catalog(imp.href)
         include_ids = (
             _collect_with_ids(imp.include_controls)
             if imp.include_controls
             else None
         )
         exclude_ids = _collect_with_ids(imp.exclude_controls)
+        if include_ids is not None:
+            # Apply the exclusions once per import instead of once per group.
+            include_ids = include_ids - exclude_ids
+            exclude_ids = frozenset()
+            if not include_ids:
+                continue
 
         for group in source_catalog.groups:
             filtered = _filter_controls(group.controls, include_ids, exclude_ids)
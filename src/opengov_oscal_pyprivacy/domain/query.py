@@ -1,37 +1,141 @@
 from __future__ import annotations
-from typing import List
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from opengov_oscal_pycore.models import Catalog, Control
-from opengov_oscal_pycore.crud_catalog import find_controls_by_prop
+from opengov_oscal_pycore.crud_catalog import find_control, find_controls_by_prop, iter_controls
 from .. import catalog_keys as K
+from ._extract import ScopedMemo
 
 
-def find_controls_by_tom_id(cat: Catalog, tom_id: str) -> List[Control]:
+@dataclass
+class PropIndex:
+    """Inverted index of a catalog's controls by prop.
+
+    ``by_value`` maps ``(name, value)`` and ``by_class_value`` maps
+    ``(name, class, value)`` to the matching controls in catalog order, each
+    control listed once. ``by_id`` maps each control ID to its first control.
+    The entries are the catalog's own control objects, so edits to a
+    control's title or parts show through. The keys are fixed at build time:
+    after adding or removing controls, or changing their IDs or props, call
+    :func:`build_prop_index` again.
+    """
+
+    by_value: Dict[Tuple[str, str], List[Control]] = field(default_factory=dict)
+    by_class_value: Dict[Tuple[str, Optional[str], str], List[Control]] = field(
+        default_factory=dict
+    )
+    by_id: Dict[str, Control] = field(default_factory=dict)
+
+
+def build_prop_index(cat: Catalog) -> PropIndex:
+    """Index every prop of every control of *cat* in one walk."""
+    index = PropIndex()
+    by_value = index.by_value
+    by_class_value = index.by_class_value
+    by_id = index.by_id
+    for c in iter_controls(cat):
+        by_id.setdefault(c.id, c)
+        for p in c.props:
+            controls = by_value.setdefault((p.name, p.value), [])
+            if not controls or controls[-1] is not c:
+                controls.append(c)
+            controls = by_class_value.setdefault((p.name, p.class_, p.value), [])
+            if not controls or controls[-1] is not c:
+                controls.append(c)
+    return index
+
+
+# Keyed on id(catalog).
+_INDEX_MEMO: ScopedMemo[PropIndex] = ScopedMemo("_INDEX_MEMO")
+
+
+@contextmanager
+def query_cache() -> Iterator[None]:
+    """Index each queried catalog once inside the ``with`` block.
+
+    The ``find_control*`` helpers then answer from a :class:`PropIndex`
+    built on first use per catalog. Catalogs are mutable, so nothing is cached
+    outside the block; do not modify the queried catalogs while it is active.
+    Nested blocks share the outermost cache. Queries made from other threads
+    or asyncio tasks are not indexed.
+    """
+    with _INDEX_MEMO.scope():
+        yield
+
+
+def _scoped_index(cat: Catalog) -> Optional[PropIndex]:
+    memo = _INDEX_MEMO.current()
+    if memo is None:
+        return None
+    hit = memo.get(id(cat))
+    if hit is not None:
+        return hit[1]
+    index = build_prop_index(cat)
+    memo[id(cat)] = (cat, index)
+    return index
+
+
+def _find(
+    cat: Catalog,
+    index: Optional[PropIndex],
+    prop_name: str,
+    prop_value: str,
+    prop_class: Optional[str] = None,
+) -> List[Control]:
+    if index is None:
+        index = _scoped_index(cat)
+    if index is None:
+        return find_controls_by_prop(
+            cat, prop_name=prop_name, prop_value=prop_value, prop_class=prop_class,
+        )
+    if prop_class is None:
+        return list(index.by_value.get((prop_name, prop_value), ()))
+    return list(index.by_class_value.get((prop_name, prop_class, prop_value), ()))
+
+
+def find_control_by_id(
+    cat: Catalog, control_id: str, *, index: Optional[PropIndex] = None,
+) -> Optional[Control]:
+    """Find a control by ID; a dict lookup when indexed."""
+    if index is None:
+        index = _scoped_index(cat)
+    if index is None:
+        return find_control(cat, control_id)
+    return index.by_id.get(control_id)
+
+
+def find_controls_by_tom_id(
+    cat: Catalog, tom_id: str, *, index: Optional[PropIndex] = None,
+) -> List[Control]:
     """Find all controls with the given SDM building-block identifier."""
-    return find_controls_by_prop(cat, prop_name=K.SDM_BUILDING_BLOCK, prop_value=tom_id)
+    return _find(cat, index, K.SDM_BUILDING_BLOCK, tom_id)
 
 
-def find_controls_by_implementation_level(cat: Catalog, level: str) -> List[Control]:
+def find_controls_by_implementation_level(
+    cat: Catalog, level: str, *, index: Optional[PropIndex] = None,
+) -> List[Control]:
     """Find all controls with the given implementation-level."""
-    return find_controls_by_prop(cat, prop_name="implementation-level", prop_value=level)
+    return _find(cat, index, "implementation-level", level)
 
 
-def find_controls_by_legal_article(cat: Catalog, article: str) -> List[Control]:
+def find_controls_by_legal_article(
+    cat: Catalog, article: str, *, index: Optional[PropIndex] = None,
+) -> List[Control]:
     """Find all controls referencing the given legal article."""
-    return find_controls_by_prop(
-        cat, prop_name=K.LEGAL, prop_value=article, prop_class=K.CLASS_PROOF,
-    )
+    return _find(cat, index, K.LEGAL, article, K.CLASS_PROOF)
 
 
-def find_controls_by_evidence(cat: Catalog, evidence_value: str) -> List[Control]:
+def find_controls_by_evidence(
+    cat: Catalog, evidence_value: str, *, index: Optional[PropIndex] = None,
+) -> List[Control]:
     """Find all controls with the given evidence artifact value."""
-    return find_controls_by_prop(
-        cat, prop_name=K.EVIDENCE, prop_value=evidence_value, prop_class=K.CLASS_ARTIFACT,
-    )
+    return _find(cat, index, K.EVIDENCE, evidence_value, K.CLASS_ARTIFACT)
 
 
-def find_controls_by_maturity_domain(cat: Catalog, domain: str) -> List[Control]:
+def find_controls_by_maturity_domain(
+    cat: Catalog, domain: str, *, index: Optional[PropIndex] = None,
+) -> List[Control]:
     """Find all controls with the given maturity domain."""
-    return find_controls_by_prop(
-        cat, prop_name=K.MATURITY, prop_value=domain, prop_class=K.CLASS_MATURITY_DOMAIN,
-    )
+    return _find(cat, index, K.MATURITY, domain, K.CLASS_MATURITY_DOMAIN)
@@ -23,32 +23,32 @@ from opengov_oscal_pycore.crud.parts import (
 )
 from opengov_oscal_pycore.crud.props import get_prop, upsert_prop
 
+from ._extract import memoized, part_prose
+
 
 # ------------------------------------------------------------------
 # Extract helpers
 # ------------------------------------------------------------------
 
+@memoized
 def extract_domain(control: Control) -> Optional[str]:
     """Return the *domain* property value, or ``None`` if absent."""
     prop = get_prop(control.props, "domain")
     return prop.value if prop is not None else None
 
 
+@memoized
 def extract_objective(control: Control) -> Optional[str]:
     """Return the *objective* property value, or ``None`` if absent."""
     prop = get_prop(control.props, "objective")
     return prop.value if prop is not None else None
 
 
+@memoized
 def extract_description(control: Control) -> Optional[str]:
     """Return the prose of the *description* part, or ``None`` if absent."""
-    part = find_part(parts_ref(control), name="description")
-    if part is None:
-        return None
     # Transparent access: works for both Part models and dicts
-    if isinstance(part, dict):
-        return part.get("prose")
-    return getattr(part, "prose", None)
+    return part_prose(find_part(parts_ref(control), name="description"))
 
 
 # ------------------------------------------------------------------
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import csv
+import io
 from dataclasses import dataclass
 from importlib.resources import files
-from typing import Any, Dict, Optional, Tuple, Literal
+from typing import Any, Dict, List, Optional, Tuple, Literal
 
-from opengov_oscal_pycore.models import Control, Property
+from pydantic import BaseModel
+
+from opengov_oscal_pycore.models import Control, Part, Property
 from opengov_oscal_pycore.crud.parts import (
-    parts_ref, ensure_part_container, _get, _set,
+    parts_ref, ensure_part_container, _container_uses_part_models, _get, _set,
 )
 from opengov_oscal_pycore.crud.props import find_props, remove_props
 
@@ -35,11 +38,11 @@ def load_risk_set() -> RiskSet:
         return _RISK_SET_CACHE
 
     path = files("opengov_oscal_pyprivacy").joinpath("data/privacy_risk_sets.csv")
-    content = path.read_text(encoding="utf-8")
-    rows = list(csv.DictReader(content.splitlines()))
-    if not rows:
+    with io.TextIOWrapper(path.open("rb"), encoding="utf-8", newline="") as fh:
+        # single-set for now; can be extended later
+        r = next(csv.DictReader(fh), None)
+    if r is None:
         raise ValueError("privacy_risk_sets.csv is empty")
-    r = rows[0]  # single-set for now; can be extended later
 
     _RISK_SET_CACHE = RiskSet(
         container_name=r["container_name"],
@@ -75,19 +78,25 @@ def _get_prop_value(part: Any, prop_name: str) -> Optional[str]:
     return None
 
 
+def _drop_props(props: List[Any], name: str, class_: str) -> None:
+    """Remove props matching name+class from *props* in place, in a single pass."""
+    w = 0
+    for p in props:
+        if not (_get(p, "name") == name and _get(p, "class", _get(p, "class_")) == class_):
+            props[w] = p
+            w += 1
+    del props[w:]
+
+
 def _set_or_replace_prop(part: Any, *, name: str, class_: str, value: str) -> None:
     """Set or replace a property on a part (dict or Part model)."""
-    from pydantic import BaseModel
     props = _get(part, "props")
     if not isinstance(props, list):
         props = []
         _set(part, "props", props)
 
     # Remove existing with same name+class
-    props[:] = [
-        p for p in props
-        if not (_get(p, "name") == name and _get(p, "class", _get(p, "class_")) == class_)
-    ]
+    _drop_props(props, name, class_)
 
     # Add new prop: use Property model if parent uses Pydantic, else dict
     if isinstance(part, BaseModel):
@@ -101,25 +110,31 @@ def _remove_prop(part: Any, *, name: str, class_: str) -> None:
     props = _get(part, "props")
     if not isinstance(props, list):
         return
-    props[:] = [
-        p for p in props
-        if not (_get(p, "name") == name and _get(p, "class", _get(p, "class_")) == class_)
-    ]
+    _drop_props(props, name, class_)
+
+
+_LEVELS: Dict[Optional[str], ImpactLevel] = {
+    "normal": "normal",
+    "moderate": "moderate",
+    "high": "high",
+}
 
 
 def _as_level(val: Optional[str]) -> Optional[ImpactLevel]:
-    if val in ("normal", "moderate", "high"):
-        return val  # type: ignore[return-value]
-    return None
+    return _LEVELS.get(val)
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def get_risk_impact_scenarios(control: Control) -> Dict[ImpactLevel, RiskImpactScenario]:
+def get_risk_impact_scenarios(
+    control: Control,
+    *,
+    parts: Optional[List[Any]] = None,
+) -> Dict[ImpactLevel, RiskImpactScenario]:
     cfg = load_risk_set()
-    root_parts = parts_ref(control)
+    root_parts = parts if parts is not None else parts_ref(control)
 
     container = None
     for p in root_parts:
@@ -181,8 +196,6 @@ def upsert_risk_impact_scenario(
 
     if existing is None:
         # Create new child matching the container's type (Part model or dict)
-        from opengov_oscal_pycore.crud.parts import _container_uses_part_models
-        from opengov_oscal_pycore.models import Part
         if _container_uses_part_models(container):
             existing = Part(
                 id=f"{control_id}-risk-impact-{level}",
@@ -215,17 +228,29 @@ def upsert_risk_impact_scenario(
 
 
 def delete_risk_impact_scenario(control: Control, level: ImpactLevel) -> None:
-    cfg = load_risk_set()
-    scenarios = get_risk_impact_scenarios(control)
-    target = scenarios.get(level)
-    if not target:
+    if _as_level(level) is None:
         return
-
+    cfg = load_risk_set()
     root_parts = parts_ref(control)
+
+    container = None
     for p in root_parts:
         if _get(p, "name") == cfg.container_name:
-            children = _get(p, "parts", []) or []
-            _set(p, "parts", [ch for ch in children if _get(ch, "id") != target.id])
-            return
+            container = p
+            break
+    children = (_get(container, "parts", []) if container is not None else root_parts) or []
 
-    root_parts[:] = [ch for ch in root_parts if _get(ch, "id") != target.id]
+    # Same target as get_risk_impact_scenarios(): the last item at this level.
+    target_id = None
+    found = False
+    for ch in children:
+        if _get(ch, "name") == cfg.item_name and _get_prop_value(ch, cfg.impact_prop_name) == level:
+            target_id = _get(ch, "id", "")
+            found = True
+    if not found:
+        return
+
+    if container is not None:
+        _set(container, "parts", [ch for ch in children if _get(ch, "id") != target_id])
+    else:
+        root_parts[:] = [ch for ch in root_parts if _get(ch, "id") != target_id]
@@ -7,38 +7,37 @@ Stateless functions that extract or mutate SDM-specific properties
 and parts on a Control object.
 """
 
-from typing import List, Optional
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from opengov_oscal_pycore.models import Control, Property
 from opengov_oscal_pycore.crud.props import find_props, get_prop, remove_props, upsert_prop
-from opengov_oscal_pycore.crud.parts import parts_ref, ensure_part_container, find_part
+from opengov_oscal_pycore.crud.parts import parts_ref, ensure_part_container, find_part, _get
 
-from ..dto.mapping import MappingRef as RelatedMapping
+from ..dto.mapping import MAPPING_REF_LIST_ADAPTER, MappingRef as RelatedMapping
 from .. import catalog_keys as K
+from ._extract import DP_GOAL_NAMES, is_dp_goal, memoized, part_prose
 
 
 # ---------------------------------------------------------------------------
 # Prop extraction
 # ---------------------------------------------------------------------------
 
+@memoized
 def extract_sdm_module(control: Control) -> Optional[str]:
     """Return the SDM building-block identifier, or *None*."""
     p = get_prop(control.props, K.SDM_BUILDING_BLOCK)
     return p.value if p else None
 
 
+@memoized
 def extract_sdm_goals(control: Control) -> List[str]:
     """Return all assurance-goal values (tolerates legacy typo ``assurnace_goal``)."""
-    names = {"assurance_goal", "assurnace_goal"}
-    props = [
-        p for p in control.props
-        if p.name in names
-        and p.class_ == K.CLASS_TELEOLOGICAL
-        and getattr(p, "group", None) == K.GROUP_AIM
-    ]
-    return [p.value for p in props]
+    return [sys.intern(p.value) for p in control.props if is_dp_goal(p)]
 
 
+@memoized
 def extract_dsgvo_articles(control: Control) -> List[str]:
     """Return DSGVO article references (name=legal, group=reference, class=proof)."""
     props = find_props(
@@ -47,32 +46,114 @@ def extract_dsgvo_articles(control: Control) -> List[str]:
         group=K.GROUP_REFERENCE,
         class_=K.CLASS_PROOF,
     )
-    return [p.value for p in props]
+    return [sys.intern(p.value) for p in props]
 
 
+@memoized
 def extract_implementation_level(control: Control) -> Optional[str]:
     """Return the implementation-level value, or *None*."""
     p = get_prop(control.props, "implementation-level")
     return p.value if p else None
 
 
+@memoized
 def extract_dp_risk_impact(control: Control) -> Optional[str]:
     """Return the data-protection risk-impact value, or *None*."""
     p = get_prop(control.props, "dp-risk-impact")
     return p.value if p else None
 
 
+def _related_mapping_data(p: Property) -> Dict[str, Any]:
+    return {
+        "scheme": getattr(p, "group", None) or "",
+        "value": p.value,
+        "remarks": p.remarks,
+    }
+
+
+def iter_related_mappings(control: Control) -> Iterator[RelatedMapping]:
+    """Yield related-mapping props as RelatedMapping DTOs, one at a time.
+
+    Each DTO is built only when the caller asks for it, so ``next()`` or
+    ``itertools.islice`` stop after the first few mappings.
+    """
+    for p in control.props or []:
+        if p.name == "related-mapping":
+            yield RelatedMapping(**_related_mapping_data(p))
+
+
+@memoized
 def extract_related_mappings(control: Control) -> List[RelatedMapping]:
     """Return all related-mapping props converted to RelatedMapping DTOs."""
-    props = find_props(control.props, name="related-mapping")
-    return [
-        RelatedMapping(
-            scheme=getattr(p, "group", None) or "",
-            value=p.value,
-            remarks=p.remarks,
-        )
-        for p in props
-    ]
+    return MAPPING_REF_LIST_ADAPTER.validate_python([
+        _related_mapping_data(p)
+        for p in control.props or []
+        if p.name == "related-mapping"
+    ])
+
+
+# ---------------------------------------------------------------------------
+# Single-pass extract bundle
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class SdmExtractBundle:
+    """All SDM prop fields of a control, as gathered by :func:`extract_sdm_bundle`."""
+    sdm_module: Optional[str]
+    sdm_goals: List[str]
+    dsgvo_articles: List[str]
+    implementation_level: Optional[str]
+    dp_risk_impact: Optional[str]
+    related_mappings: List[RelatedMapping]
+
+
+@memoized
+def extract_sdm_bundle(control: Control) -> SdmExtractBundle:
+    """Gather every SDM prop field of *control* in one pass over its props.
+
+    Equivalent to calling the individual ``extract_*`` helpers above, but
+    without re-scanning ``control.props`` per field.
+    """
+    sdm_module: Optional[Property] = None
+    sdm_goals: List[str] = []
+    dsgvo_articles: List[str] = []
+    implementation_level: Optional[Property] = None
+    dp_risk_impact: Optional[Property] = None
+    related_mappings: List[Dict[str, Any]] = []
+
+    for p in control.props or []:
+        name = p.name
+        if name == K.LEGAL:
+            if getattr(p, "group", None) == K.GROUP_REFERENCE and p.class_ == K.CLASS_PROOF:
+                dsgvo_articles.append(sys.intern(p.value))
+        elif name in DP_GOAL_NAMES:
+            if p.class_ == K.CLASS_TELEOLOGICAL and getattr(p, "group", None) == K.GROUP_AIM:
+                sdm_goals.append(sys.intern(p.value))
+        elif name == K.SDM_BUILDING_BLOCK:
+            if sdm_module is None:
+                sdm_module = p
+        elif name == "implementation-level":
+            if implementation_level is None:
+                implementation_level = p
+        elif name == "dp-risk-impact":
+            if dp_risk_impact is None:
+                dp_risk_impact = p
+        elif name == "related-mapping":
+            related_mappings.append(_related_mapping_data(p))
+
+    return SdmExtractBundle(
+        sdm_module=sdm_module.value if sdm_module is not None else None,
+        sdm_goals=sdm_goals,
+        dsgvo_articles=dsgvo_articles,
+        implementation_level=(
+            implementation_level.value if implementation_level is not None else None
+        ),
+        dp_risk_impact=dp_risk_impact.value if dp_risk_impact is not None else None,
+        related_mappings=(
+            MAPPING_REF_LIST_ADAPTER.validate_python(related_mappings)
+            if related_mappings else []
+        ),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -98,41 +179,62 @@ def set_dp_risk_impact(control: Control, impact: str) -> None:
 
 
 def replace_related_mappings(control: Control, mappings: List[RelatedMapping]) -> None:
-    """Remove all existing related-mapping props and insert *mappings*."""
+    """Remove all existing related-mapping props and insert *mappings*.
+
+    Mappings with the same scheme and value collapse into one prop, which
+    keeps the first position and the last remarks.
+    """
     remove_props(control.props, name="related-mapping")
+    # The old props are gone, so duplicates can only occur within *mappings*.
+    by_key: Dict[Tuple[str, str], Property] = {}
     for m in mappings:
-        upsert_prop(
-            control.props,
-            Property(
-                name="related-mapping",
-                value=m.value,
-                group=m.scheme,
-                remarks=m.remarks,
-            ),
-            key=("name", "group", "value"),
+        existing = by_key.get((m.scheme, m.value))
+        if existing is not None:
+            existing.remarks = m.remarks
+            continue
+        by_key[(m.scheme, m.value)] = Property(
+            name="related-mapping",
+            value=m.value,
+            group=m.scheme,
+            remarks=m.remarks,
         )
+    control.props.extend(by_key.values())
 
 
 # ---------------------------------------------------------------------------
 # SDM-TOM parts (prose containers)
 # ---------------------------------------------------------------------------
 
+@memoized
 def extract_sdm_tom_description(control: Control) -> Optional[str]:
     """Return the prose of the ``description`` part, or *None*."""
-    parts = parts_ref(control)
-    p = find_part(parts, name="description")
-    if p is None:
-        return None
-    return getattr(p, "prose", None) if not isinstance(p, dict) else p.get("prose")
+    return part_prose(find_part(parts_ref(control), name="description"))
 
 
+@memoized
 def extract_sdm_tom_implementation_hints(control: Control) -> Optional[str]:
     """Return the prose of the ``implementation-hints`` part, or *None*."""
-    parts = parts_ref(control)
-    p = find_part(parts, name="implementation-hints")
-    if p is None:
-        return None
-    return getattr(p, "prose", None) if not isinstance(p, dict) else p.get("prose")
+    return part_prose(find_part(parts_ref(control), name="implementation-hints"))
+
+
+_SDM_TOM_PART_NAMES = ("description", "implementation-hints")
+
+
+@memoized
+def extract_sdm_tom_prose_map(control: Control) -> Dict[str, Optional[str]]:
+    """Return the prose of both SDM-TOM parts in one walk over the parts.
+
+    Keys are ``"description"`` and ``"implementation-hints"``; a missing part
+    maps to *None*. As with :func:`find_part`, the first part per name wins.
+    """
+    found: Dict[str, Any] = {}
+    for p in parts_ref(control):
+        name = _get(p, "name")
+        if name in _SDM_TOM_PART_NAMES and name not in found:
+            found[name] = p
+            if len(found) == len(_SDM_TOM_PART_NAMES):
+                break
+    return {name: part_prose(found.get(name)) for name in _SDM_TOM_PART_NAMES}
 
 
 def set_sdm_tom_description(control: Control, prose: str) -> None:
@@ -7,8 +7,9 @@ Provides helpers for generating implemented-requirement stubs from a resolved
 catalog, attaching evidence resources, and accessing the import-profile href.
 """
 
+import functools
 import uuid as _uuid
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from opengov_oscal_pycore.models import BackMatter, Link, Resource
 from opengov_oscal_pycore.models_ssp import (
@@ -19,6 +20,14 @@ from opengov_oscal_pycore.crud_catalog import iter_controls
 from opengov_oscal_pycore.crud.back_matter import add_resource
 from opengov_oscal_pycore.models import Catalog
 
+_NAMESPACE_IR = _uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")  # URL namespace
+
+
+@functools.lru_cache(maxsize=4096)
+def _ir_uuid(control_id: str) -> str:
+    """Deterministic implemented-requirement UUID for a control ID (cached)."""
+    return str(_uuid.uuid5(_NAMESPACE_IR, f"ir-{control_id}"))
+
 
 def generate_implemented_requirements(
     resolved_catalog: Catalog,
@@ -30,31 +39,45 @@ def generate_implemented_requirements(
     - control_id: the control's ID
     - description: empty string (to be filled by implementer)
     """
-    requirements: List[SspImplementedRequirement] = []
-    namespace = _uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")  # URL namespace
-
-    for ctrl in iter_controls(resolved_catalog):
-        req_uuid = str(_uuid.uuid5(namespace, f"ir-{ctrl.id}"))
-        requirements.append(
-            SspImplementedRequirement(
-                uuid=req_uuid,
-                control_id=ctrl.id,  # will use alias "control-id" on export
-                description="",
-            )
+    return [
+        SspImplementedRequirement(
+            uuid=_ir_uuid(ctrl.id),
+            control_id=ctrl.id,  # will use alias "control-id" on export
+            description="",
         )
+        for ctrl in iter_controls(resolved_catalog)
+    ]
+
+
+def index_implemented_requirements(
+    ssp: SystemSecurityPlan,
+) -> Dict[str, SspImplementedRequirement]:
+    """Map control IDs to the SSP's implemented requirements (first per ID).
 
-    return requirements
+    Pass the result as ``ir_index=`` when attaching many evidence resources to
+    one SSP. The values are the SSP's own requirement objects, so links added
+    through it land in the SSP; requirements added, removed or re-pointed to
+    another control afterwards are not in it.
+    """
+    index: Dict[str, SspImplementedRequirement] = {}
+    if ssp.control_implementation:
+        for ir in ssp.control_implementation.implemented_requirements:
+            index.setdefault(ir.control_id, ir)
+    return index
 
 
 def attach_evidence_to_ssp(
     ssp: SystemSecurityPlan,
     resource: Resource,
     statement_control_id: Optional[str] = None,
+    *,
+    ir_index: Optional[Dict[str, SspImplementedRequirement]] = None,
 ) -> None:
     """Attach an evidence resource to an SSP.
 
     - Adds the resource to SSP's back_matter
     - If statement_control_id is given, adds a link to the matching implemented-requirement
+      (looked up in *ir_index* when given, see :func:`index_implemented_requirements`)
     """
     # Ensure back_matter exists
     if ssp.back_matter is None:
@@ -65,15 +88,24 @@ def attach_evidence_to_ssp(
 
     # If a control ID is specified, link the resource to the matching IR
     if statement_control_id and ssp.control_implementation:
-        for ir in ssp.control_implementation.implemented_requirements:
-            if ir.control_id == statement_control_id:
-                ir.links.append(
-                    Link(
-                        href=f"#{resource.uuid}",
-                        rel="evidence",
-                    )
+        if ir_index is not None:
+            ir = ir_index.get(statement_control_id)
+        else:
+            ir = next(
+                (
+                    ir
+                    for ir in ssp.control_implementation.implemented_requirements
+                    if ir.control_id == statement_control_id
+                ),
+                None,
+            )
+        if ir is not None:
+            ir.links.append(
+                Link(
+                    href=f"#{resource.uuid}",
+                    rel="evidence",
                 )
-                break
+            )
 
 
 def get_import_profile_href(ssp: SystemSecurityPlan) -> Optional[str]:
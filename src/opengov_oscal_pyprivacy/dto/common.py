@@ -1,7 +1,13 @@
 from __future__ import annotations
-from pydantic import BaseModel, ConfigDict
+from typing import Final, List
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 class DtoBaseModel(BaseModel):
+    # DTOs stay pydantic models (not slotted dataclasses or msgspec structs):
+    # API consumers rely on alias-based (camelCase) validation and
+    # model_dump(by_alias=True). Pydantic already keeps its per-instance
+    # bookkeeping in __slots__; only the declared fields live in __dict__.
     model_config = ConfigDict(populate_by_name=True)
 
 class TextItemCreate(DtoBaseModel):
@@ -13,3 +19,7 @@ class TextItemUpdate(DtoBaseModel):
 class TextItem(DtoBaseModel):
     id: str
     prose: str
+
+# Validates a list of {"id", "prose"} dicts (as returned by
+# list_typical_measures()) in one call instead of one TextItem(...) per item.
+TEXT_ITEM_LIST_ADAPTER: Final = TypeAdapter(List[TextItem])
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
-from typing import List, Optional, Literal
-from pydantic import Field, field_validator
+from typing import Final, FrozenSet, List, Optional, Literal
+from pydantic import Field, TypeAdapter, field_validator
 from opengov_oscal_pyprivacy.vocab import load_default_privacy_vocabs
 
 from .common import DtoBaseModel
 
-_VOCABS = None
+# Known mapping scheme codes, loaded on first validation.
+_SCHEMES: Optional[FrozenSet[str]] = None
 
-def _vocabs():
-    global _VOCABS
-    if _VOCABS is None:
-        _VOCABS = load_default_privacy_vocabs()
-    return _VOCABS
+def _mapping_schemes() -> FrozenSet[str]:
+    global _SCHEMES
+    if _SCHEMES is None:
+        _SCHEMES = frozenset(load_default_privacy_vocabs().mapping_schemes.keys)
+    return _SCHEMES
 
 class MappingRef(DtoBaseModel):
     scheme: str
@@ -23,17 +24,21 @@ class MappingRef(DtoBaseModel):
     @classmethod
     def validate_scheme(cls, v: str) -> str:
         v = (v or "").strip()
-        if v not in _vocabs().mapping_schemes.keys:
+        if v not in (_SCHEMES or _mapping_schemes()):
             raise ValueError(f"Unknown mapping scheme: {v}")
         return v
 
+# Validates a list of {"scheme", "value", "remarks"} dicts in one call
+# instead of one MappingRef(...) per item.
+MAPPING_REF_LIST_ADAPTER: Final = TypeAdapter(List[MappingRef])
+
 class MappingRule(DtoBaseModel):
     """
     A single mapping statement, e.g.:
     privacy_control_id -> [ {scheme: "sdm", value:"TOM-03"} ]
     """
     source_id: str
-    targets: List[MappingRef] = []
+    targets: List[MappingRef] = Field(default_factory=list)
     confidence: Optional[float] = Field(default=None, ge=0.0, le=1.0)
     rationale: Optional[str] = None
 
@@ -45,7 +50,7 @@ class MappingSetMeta(DtoBaseModel):
 
 class MappingSet(DtoBaseModel):
     meta: MappingSetMeta
-    rules: List[MappingRule] = []
+    rules: List[MappingRule] = Field(default_factory=list)
 
 class MappingHit(DtoBaseModel):
     source_id: str
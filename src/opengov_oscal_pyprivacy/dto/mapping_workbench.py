@@ -20,6 +20,6 @@ class MappingStandards(DtoBaseModel):
 class SdmSecurityMapping(DtoBaseModel):
     sdm_control_id: str = Field(alias="sdmControlId")
     sdm_title: str = Field(alias="sdmTitle")
-    security_controls: List[SecurityControlRef] = Field(default=[], alias="securityControls")
-    standards: MappingStandards = MappingStandards()
+    security_controls: List[SecurityControlRef] = Field(default_factory=list, alias="securityControls")
+    standards: MappingStandards = Field(default_factory=MappingStandards)
     notes: Optional[str] = None
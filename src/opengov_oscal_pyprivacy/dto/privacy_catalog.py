@@ -17,13 +17,13 @@ class PrivacyControlSummary(DtoBaseModel):
     title: str
     group_id: Optional[str] = None
     tom_id: Optional[str] = None
-    dsgvo_articles: List[str] = []
-    dp_goals: List[str] = []
+    dsgvo_articles: List[str] = Field(default_factory=list)
+    dp_goals: List[str] = Field(default_factory=list)
 
 class PrivacyGroupDetail(PrivacyGroupSummary):
     description: Optional[str] = None
     control_count: int = Field(alias="controlCount")
-    controls: List[PrivacyControlSummary] = []
+    controls: List[PrivacyControlSummary] = Field(default_factory=list)
 
 class PrivacyRiskScenario(DtoBaseModel):
     title: Optional[str] = None
@@ -41,8 +41,8 @@ class PrivacyControlDetail(DtoBaseModel):
     title: str
     group_id: Optional[str] = None
     tom_id: Optional[str] = None
-    dsgvo_articles: List[str] = []
-    dp_goals: List[str] = []
+    dsgvo_articles: List[str] = Field(default_factory=list)
+    dp_goals: List[str] = Field(default_factory=list)
 
     statement: Optional[str] = None
     maturity_hints: Optional[str] = None
@@ -51,11 +51,11 @@ class PrivacyControlDetail(DtoBaseModel):
     maturity_level_5: Optional[str] = None
 
     # CRUD-ready (IDs sind wichtig!)
-    typical_measures: List[TextItem] = []
-    assessment_questions: List[TextItem] = []
+    typical_measures: List[TextItem] = Field(default_factory=list)
+    assessment_questions: List[TextItem] = Field(default_factory=list)
 
     risk_hint: Optional[str] = None
-    risk_scenarios: List[PrivacyRiskScenario] = []
+    risk_scenarios: List[PrivacyRiskScenario] = Field(default_factory=list)
 
     # Risk impact guidance: drei feste Felder (UI-freundlich)
     risk_impact_normal: Optional[PrivacyRiskImpactScenario] = None
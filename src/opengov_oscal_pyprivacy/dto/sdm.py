@@ -7,8 +7,8 @@ from .mapping import MappingRef as RelatedMapping
 
 class SdmControlSummaryProps(DtoBaseModel):
     sdm_module: Optional[str] = Field(default=None, alias="sdmModule")
-    sdm_goals: List[str] = Field(default=[], alias="sdmGoals")
-    dsgvo_articles: List[str] = Field(default=[], alias="dsgvoArticles")
+    sdm_goals: List[str] = Field(default_factory=list, alias="sdmGoals")
+    dsgvo_articles: List[str] = Field(default_factory=list, alias="dsgvoArticles")
 
 class SdmControlSummary(DtoBaseModel):
     id: str
@@ -19,7 +19,7 @@ class SdmControlSummary(DtoBaseModel):
 class SdmControlDetailProps(SdmControlSummaryProps):
     implementation_level: Optional[str] = Field(default=None, alias="implementationLevel")
     dp_risk_impact: Optional[str] = Field(default=None, alias="dpRiskImpact")
-    related_mappings: List[RelatedMapping] = Field(default=[], alias="relatedMappings")
+    related_mappings: List[RelatedMapping] = Field(default_factory=list, alias="relatedMappings")
 
 class SdmControlDetail(DtoBaseModel):
     id: str
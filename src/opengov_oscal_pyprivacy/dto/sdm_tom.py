@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import List, Optional
+from pydantic import Field
 
 from .common import DtoBaseModel
 
@@ -9,8 +10,8 @@ class SdmTomControlSummary(DtoBaseModel):
     id: str
     title: str
     sdm_module: Optional[str] = None
-    sdm_goals: List[str] = []
-    dsgvo_articles: List[str] = []
+    sdm_goals: List[str] = Field(default_factory=list)
+    dsgvo_articles: List[str] = Field(default_factory=list)
 
 
 class SdmTomControlDetail(SdmTomControlSummary):
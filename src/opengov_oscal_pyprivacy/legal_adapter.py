@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Optional, List
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, List, Tuple
 
 from opengov_oscal_pycore.models import Control, Property
 
@@ -37,6 +38,42 @@ def list_normalized_legal_ids(control: Control, spec: LegalPropSpec = LegalPropS
     return ids
 
 
+def _find_legal_prop(control: Control, norm_str: str, spec: LegalPropSpec) -> Optional[Property]:
+    for p in control.props:
+        if p.name == spec.name and p.value == norm_str:
+            return p
+    return None
+
+
+def _put_legal_prop(
+    control: Control,
+    norm_str: str,
+    label: Optional[str],
+    spec: LegalPropSpec,
+    existing: Optional[Property],
+) -> Property:
+    """Update *existing* (the current prop for *norm_str*) or append a new prop."""
+    if existing is not None:
+        # ensure spec fields are enforced
+        existing.ns = spec.ns
+        existing.group = spec.group
+        existing.class_ = spec.class_
+        if label:
+            existing.remarks = label
+        return existing
+
+    prop = Property(
+        name=spec.name,
+        value=norm_str,
+        ns=spec.ns,
+        group=spec.group,
+        class_=spec.class_,
+        remarks=label,
+    )
+    control.props.append(prop)
+    return prop
+
+
 def add_legal_id(
     control: Control,
     norm_id: str | NormIdentity,
@@ -56,26 +93,25 @@ def add_legal_id(
     norm_str = str(norm_id)
 
     # Do not duplicate the same norm id
-    for p in control.props:
-        if p.name == spec.name and p.value == norm_str:
-            # ensure spec fields are enforced
-            p.ns = spec.ns
-            p.group = spec.group
-            p.class_ = spec.class_
-            if label:
-                p.remarks = label
-            return
-
-    control.props.append(
-        Property(
-            name=spec.name,
-            value=norm_str,
-            ns=spec.ns,
-            group=spec.group,
-            class_=spec.class_,
-            remarks=label,
-        )
-    )
+    _put_legal_prop(control, norm_str, label, spec, _find_legal_prop(control, norm_str, spec))
+
+
+@lru_cache(maxsize=4096)
+def _parse_legal_refs(text: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Return ``(normalized id, label)`` for each reference in *text*.
+
+    Boilerplate legal text recurs across controls, so parses are cached per
+    text. Only strings are cached, never the parser's reference objects.
+    """
+    out: List[Tuple[str, Optional[str]]] = []
+    for ref in parse_norm_references(text):
+        identity = getattr(ref, "identity", None)
+        if identity is None:
+            continue
+        # keep the human-readable original if available
+        label = getattr(ref, "original", None) or getattr(ref, "label", None)
+        out.append((str(identity), label))
+    return tuple(out)
 
 
 def normalize_legal_from_text(
@@ -90,19 +126,24 @@ def normalize_legal_from_text(
     Uses the default CSV-backed registry shipped with opengov-pylegal-utils.
     Returns the list of normalized identifiers added/ensured.
     """
-    refs = parse_norm_references(text)
+    refs = _parse_legal_refs(text)
     added: List[str] = []
+    if not refs:
+        return added
 
-    for ref in refs:
-        identity = getattr(ref, "identity", None)
-        if identity is None:
-            continue
+    if control.props is None:
+        control.props = []
 
-        # keep the human-readable original if available
-        label = getattr(ref, "original", None) or getattr(ref, "label", None)
+    # Index the legal props once instead of rescanning control.props per
+    # reference; the first prop per value wins, as in add_legal_id().
+    by_value: Dict[str, Property] = {}
+    for p in control.props:
+        if p.name == spec.name:
+            by_value.setdefault(p.value, p)
 
-        add_legal_id(control, identity, label=label, spec=spec)
-        added.append(str(identity))
+    for norm_str, label in refs:
+        by_value[norm_str] = _put_legal_prop(control, norm_str, label, spec, by_value.get(norm_str))
+        added.append(norm_str)
 
     return added
 
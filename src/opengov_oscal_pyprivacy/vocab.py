@@ -107,7 +107,7 @@ def load_privacy_vocabs(data_dir: Path) -> PrivacyVocabs:
         DeprecationWarning,
         stacklevel=2,
     )
-    registry = CodelistRegistry.load_defaults()
+    registry = CodelistRegistry.default_registry()
     return PrivacyVocabs(
         **{
             attr: _codelist_to_vocab(registry, list_id)
@@ -140,7 +140,7 @@ def load_default_privacy_vocabs() -> PrivacyVocabs:
         DeprecationWarning,
         stacklevel=2,
     )
-    registry = CodelistRegistry.load_defaults()
+    registry = CodelistRegistry.default_registry()
     return PrivacyVocabs(
         **{
             attr: _codelist_to_vocab(registry, list_id)
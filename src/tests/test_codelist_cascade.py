@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
 from opengov_oscal_pyprivacy.codelist.cascade import CascadeImpact, CascadeService
+from opengov_oscal_pyprivacy.codelist.models import (
+    CascadeEffect,
+    CascadeRule,
+    CodeEntry,
+    CodeEntryMetadata,
+    CodeLabel,
+    Codelist,
+)
 from opengov_oscal_pyprivacy.codelist.registry import CodelistRegistry
 
 
@@ -111,6 +121,15 @@ class TestEvaluateImpact:
         impacts = cascade.evaluate_impact("nonexistent")
         assert impacts == []
 
+    def test_impacts_are_frozen_and_hashable(
+        self, cascade: CascadeService
+    ) -> None:
+        """CascadeImpact is immutable and can be used in sets."""
+        impacts = cascade.evaluate_impact("health-data")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            impacts[0].severity = "info"  # type: ignore[misc]
+        assert len(set(impacts)) == len(impacts)
+
 
 # ------------------------------------------------------------------
 # TestSuggestChanges
@@ -193,3 +212,66 @@ class TestTransferRules:
             and i.required_value == "scc"
         ]
         assert len(transfer_impacts) >= 1
+
+
+# ------------------------------------------------------------------
+# TestSourceFieldAccess
+# ------------------------------------------------------------------
+
+
+class TestSourceFieldAccess:
+    """Tests for rule source_field resolution on custom codelists."""
+
+    @staticmethod
+    def _service(source_field: str, condition: str) -> CascadeService:
+        registry = CodelistRegistry()
+        registry.register(
+            Codelist(
+                list_id="data-categories",
+                version="1.0",
+                namespace_uri="urn:test:data-categories",
+                title=CodeLabel(en="Data Categories"),
+                entries=[
+                    CodeEntry(
+                        code="biometric",
+                        labels=CodeLabel(en="Biometric"),
+                        metadata=CodeEntryMetadata(
+                            group="special", extra={"sensitivity": "high"}
+                        ),
+                    ),
+                ],
+            )
+        )
+        rule = CascadeRule(
+            rule_id="R-1",
+            source_list="data-categories",
+            source_field=source_field,
+            condition=condition,
+            effects=[
+                CascadeEffect(
+                    target_list="dpia",
+                    target_field="required",
+                    operator="flag",
+                    value="true",
+                    description=CodeLabel(en="DPIA"),
+                )
+            ],
+            description=CodeLabel(en="Rule"),
+        )
+        return CascadeService(registry, [rule])
+
+    def test_metadata_extra_field(self) -> None:
+        """metadata.<key> falls back to metadata.extra."""
+        svc = self._service("metadata.sensitivity", "== 'high'")
+        impacts = svc.evaluate_impact("biometric")
+        assert [i.rule_id for i in impacts] == ["R-1"]
+
+    def test_metadata_model_field(self) -> None:
+        """metadata.<field> reads the metadata attribute."""
+        svc = self._service("metadata.group", "in ['special', 'criminal']")
+        assert len(svc.evaluate_impact("biometric")) == 1
+
+    def test_code_field_no_match(self) -> None:
+        """A non-matching condition yields no impacts."""
+        svc = self._service("code", "!= 'biometric'")
+        assert svc.evaluate_impact("biometric") == []
@@ -195,3 +195,19 @@ class TestGenericodeRoundtrip:
             assert len(codes) == len(set(codes)), (
                 f"{list_id}: duplicate codes in reimport"
             )
+
+    def test_import_str_ignores_declared_encoding(self) -> None:
+        """A str is already decoded; a non-UTF-8 declaration must not re-decode it."""
+        cl = Codelist(
+            list_id="accents",
+            version="1.0",
+            namespace_uri="urn:accents",
+            title=CodeLabel(en="Accents"),
+            entries=[CodeEntry(code="e", labels=CodeLabel(en="é", de="é"))],
+        )
+        xml = export_genericode(cl).replace(
+            "encoding='utf-8'", "encoding='ISO-8859-1'", 1
+        )
+        assert "ISO-8859-1" in xml
+        reimported = import_genericode(xml)
+        assert reimported.entries[0].get_label("de") == "é"
@@ -100,6 +100,11 @@ class TestCodeLabel:
         # en is "", which is falsy, so fallback_code is returned
         assert result == "MY_CODE"
 
+    def test_get_non_locale_attribute_name(self) -> None:
+        """Names of model attributes that are not locales fall back to 'en'."""
+        label = CodeLabel(en="Hello")
+        assert label.get("model_fields") == "Hello"
+
     def test_extra_field_forbidden(self) -> None:
         """CodeLabel rejects unknown fields (extra='forbid')."""
         with pytest.raises(ValidationError):
@@ -108,6 +108,15 @@ class TestRegistryBasics:
         reg.register(_make_codelist("mid"))
         assert reg.list_ids() == ["alpha", "mid", "zebra"]
 
+    def test_list_ids_after_later_register(self) -> None:
+        """The cached ID order is refreshed when another list is registered."""
+        reg = CodelistRegistry()
+        reg.register(_make_codelist("zebra"))
+        ids = reg.list_ids()
+        ids.append("junk")
+        reg.register(_make_codelist("alpha"))
+        assert reg.list_ids() == ["alpha", "zebra"]
+
     def test_register_overwrites(self) -> None:
         """Registering the same list_id again overwrites the previous."""
         reg = CodelistRegistry()
@@ -119,6 +128,78 @@ class TestRegistryBasics:
         assert result is cl2
         assert len(result.entries) == 2
 
+    def test_search_reflects_reregistration(self) -> None:
+        """search() does not serve stale results after a list is replaced."""
+        reg = CodelistRegistry()
+        reg.register(_make_codelist("dup", codes=["x"]))
+        assert [e.code for e in reg.search("dup", "x")] == ["x"]
+        reg.register(_make_codelist("dup", codes=["y", "z"]))
+        assert reg.search("dup", "x") == []
+        assert [e.code for e in reg.search("dup", "Y")] == ["y"]
+
+    def test_search_matches_each_entry_once(self) -> None:
+        """Repeated occurrences in a label yield one result per entry, in order."""
+        reg = CodelistRegistry()
+        reg.register(_make_codelist("rep", codes=["abab", "b", "cab"]))
+        assert [e.code for e in reg.search("rep", "AB")] == ["abab", "cab"]
+        assert [e.code for e in reg.search("rep", "b")] == ["abab", "b", "cab"]
+        assert reg.search("rep", "b\x00c") == []
+
+    def test_list_codes_cached_result_is_isolated(self) -> None:
+        """Mutating a list_codes() result does not affect later calls."""
+        reg = CodelistRegistry()
+        reg.register(_make_codelist("iso", codes=["a", "b"]))
+        first = reg.list_codes("iso")
+        first.append("zzz")
+        assert reg.list_codes("iso") == ["a", "b"]
+        reg.register(_make_codelist("iso", codes=["c"]))
+        assert reg.list_codes("iso") == ["c"]
+
+
+class TestSearchPrefix:
+    """Tests for CodelistRegistry.search_prefix()."""
+
+    @pytest.fixture
+    def reg(self) -> CodelistRegistry:
+        reg = CodelistRegistry()
+        reg.register(
+            Codelist(
+                list_id="cats",
+                version="1.0.0",
+                namespace_uri="urn:test:cats",
+                title=CodeLabel(en="Categories"),
+                entries=[
+                    CodeEntry(code="health", labels=CodeLabel(en="Health Data")),
+                    CodeEntry(code="contact", labels=CodeLabel(en="Contact Data")),
+                    CodeEntry(code="healthcare", labels=CodeLabel(en="Healthcare Provider")),
+                ],
+            )
+        )
+        return reg
+
+    def test_prefix_of_label(self, reg: CodelistRegistry) -> None:
+        """Matches labels starting with the prefix, in entry order."""
+        assert [e.code for e in reg.search_prefix("cats", "heal")] == ["health", "healthcare"]
+
+    def test_prefix_of_word(self, reg: CodelistRegistry) -> None:
+        """Matches any word of the label, case-insensitively."""
+        assert [e.code for e in reg.search_prefix("cats", "DAT")] == ["health", "contact"]
+
+    def test_infix_does_not_match(self, reg: CodelistRegistry) -> None:
+        """Only prefixes match, unlike search()."""
+        assert reg.search_prefix("cats", "ealth") == []
+        assert len(reg.search("cats", "ealth")) == 2
+
+    def test_get_by_label(self, reg: CodelistRegistry) -> None:
+        """Exact, case-insensitive label lookup."""
+        assert reg.get_by_label("cats", "health data").code == "health"
+        assert reg.get_by_label("cats", "HEALTHCARE PROVIDER").code == "healthcare"
+        assert reg.get_by_label("cats", "Health") is None
+
+    def test_unknown_list(self, reg: CodelistRegistry) -> None:
+        with pytest.raises(KeyError):
+            reg.search_prefix("nope", "a")
+
 
 # ===========================================================================
 # load_defaults
@@ -156,6 +237,13 @@ class TestRegistryLoadDefaults:
         }
         assert expected.issubset(set(registry.list_ids()))
 
+    def test_default_registry_is_shared(self) -> None:
+        """default_registry() returns one shared instance; load_defaults() does not."""
+        shared = CodelistRegistry.default_registry()
+        assert CodelistRegistry.default_registry() is shared
+        assert CodelistRegistry.load_defaults() is not shared
+        assert shared.list_ids() == CodelistRegistry.load_defaults().list_ids()
+
 
 # ===========================================================================
 # Registry queries
@@ -20,6 +20,7 @@ import pytest
 from opengov_oscal_pycore.models import Catalog, Control, Group
 
 from opengov_oscal_pyprivacy.converters.privacy_converter import (
+    LazyPrivacyControlDetail,
     control_to_privacy_summary,
     control_to_privacy_detail,
     group_to_privacy_summary,
@@ -294,6 +295,45 @@ def test_group_to_privacy_detail_no_controls(gov_group: Group):
     assert result.controls == []
 
 
+def test_group_to_privacy_detail_parallel_keeps_order(monkeypatch: pytest.MonkeyPatch):
+    """The thread-pool path (free-threaded builds) preserves control order."""
+    from opengov_oscal_pyprivacy.converters import _parallel
+
+    monkeypatch.setattr(_parallel, "_gil_disabled", lambda: True)
+    n = _parallel.PARALLEL_THRESHOLD + 10
+    group = Group(
+        id="big",
+        title="Big",
+        controls=[Control(id=f"C-{i:03d}", title=f"Control {i}") for i in range(n)],
+    )
+    result = group_to_privacy_detail(group)
+
+    assert [c.id for c in result.controls] == [f"C-{i:03d}" for i in range(n)]
+    assert all(c.group_id == "big" for c in result.controls)
+
+
+def test_lazy_privacy_detail_computes_on_access(gov01: Control, monkeypatch: pytest.MonkeyPatch):
+    """Only the accessed fields are extracted; to_dto() matches the eager converter."""
+    from opengov_oscal_pyprivacy.converters import privacy_converter
+
+    calls = []
+    real_bundle = privacy_converter.extract_bundle
+    monkeypatch.setattr(
+        privacy_converter,
+        "extract_bundle",
+        lambda c, **kw: calls.append(c) or real_bundle(c, **kw),
+    )
+    lazy = LazyPrivacyControlDetail(gov01, group_id="GOV")
+    assert lazy.id == gov01.id
+    assert calls == []
+
+    assert lazy.statement
+    assert lazy.dsgvo_articles
+    assert len(calls) == 1
+
+    assert lazy.to_dto() == control_to_privacy_detail(gov01, group_id="GOV")
+
+
 # =====================================================================
 # 9. test_privacy_detail_serialization
 # =====================================================================
@@ -296,6 +296,31 @@ class TestOscalDiffService:
         result = svc.diff_controls(old, new)
         assert result.summary.changed >= 1
 
+    def test_service_diff_controls_batch(self):
+        svc = OscalDiffService()
+        pairs = [
+            (Control(id="c1", title="A"), Control(id="c1", title="B")),
+            (Control(id="c2", title="A"), Control(id="c2", title="A")),
+        ]
+        results = svc.diff_controls_batch(pairs)
+        assert [r.summary.changed for r in results] == [1, 0]
+
+    def test_service_diff_controls_batch_executor_matches_serial(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        svc = OscalDiffService()
+        pairs = [
+            (
+                Control(id=f"c{i}", title="A", props=[Property(name="p", value="1")]),
+                Control(id=f"c{i}", title=f"B{i % 2}", props=[Property(name="p", value=str(i))]),
+            )
+            for i in range(20)
+        ]
+        expected = [svc.diff_controls(old, new) for old, new in pairs]
+        assert svc.diff_controls_batch(pairs) == expected
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            assert svc.diff_controls_batch(pairs, executor=pool) == expected
+
     def test_service_format_diff_summary(self):
         svc = OscalDiffService()
         result = OscalDiffResult(
@@ -316,6 +341,16 @@ class TestOscalDiffService:
         assert "new: B" in text
         assert "+ groups[0].controls[1]" in text
 
+    def test_service_diff_files_nonstandard_numbers(self, tmp_path):
+        """NaN and wide integers parse the same with or without orjson."""
+        old_file = tmp_path / "old.json"
+        new_file = tmp_path / "new.json"
+        old_file.write_text('{"a": NaN, "b": 1}', encoding="utf-8")
+        new_file.write_text('{"a": NaN, "b": 123456789012345678901234567890}', encoding="utf-8")
+        result = OscalDiffService().diff_files(old_file, new_file)
+        assert result.summary.changed >= 1
+        assert any(c.new_value == 123456789012345678901234567890 for c in result.changes)
+
     def test_service_diff_files(self, tmp_path):
         old_data = {"catalog": {"uuid": "u1", "metadata": {"title": "A"}}}
         new_data = {"catalog": {"uuid": "u1", "metadata": {"title": "B"}}}
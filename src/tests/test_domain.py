@@ -14,6 +14,7 @@ from pathlib import Path
 import pytest
 
 from opengov_oscal_pycore.models import Catalog, Control, Property, Part
+from opengov_oscal_pycore.crud.parts import parts_ref
 
 
 # ── SDM Catalog imports ──────────────────────────────────────────────
@@ -27,9 +28,12 @@ from opengov_oscal_pyprivacy.domain.sdm_catalog import (
     set_dp_risk_impact,
     extract_related_mappings,
     replace_related_mappings,
+    extract_sdm_bundle,
+    iter_related_mappings,
     extract_sdm_tom_description,
     set_sdm_tom_description,
     extract_sdm_tom_implementation_hints,
+    extract_sdm_tom_prose_map,
     set_sdm_tom_implementation_hints,
 )
 from opengov_oscal_pyprivacy.dto.mapping import MappingRef as RelatedMapping
@@ -56,6 +60,11 @@ from opengov_oscal_pyprivacy.domain.privacy_control import (
     extract_maturity_domain,
     extract_maturity_requirement,
     extract_measure_category,
+    extract_bundle,
+    extract_cache,
+    list_dp_goals,
+    list_typical_measures,
+    list_assessment_questions,
 )
 
 
@@ -162,6 +171,50 @@ class TestSdmCatalog:
         assert result[1].scheme == "bsi_itgrundschutz"
         assert result[1].value == "SYS.1.1"
 
+    def test_replace_related_mappings_collapses_duplicates(self, sdm_control: Control):
+        replace_related_mappings(sdm_control, [
+            RelatedMapping(scheme="sdm", value="TOM-03", remarks="first"),
+            RelatedMapping(scheme="sdm", value="TOM-04", remarks=None),
+            RelatedMapping(scheme="sdm", value="TOM-03", remarks="last"),
+        ])
+        result = extract_related_mappings(sdm_control)
+        assert [(m.value, m.remarks) for m in result] == [("TOM-03", "last"), ("TOM-04", None)]
+        # Replacing again drops the previous mappings.
+        replace_related_mappings(sdm_control, [])
+        assert extract_related_mappings(sdm_control) == []
+        assert extract_sdm_module(sdm_control) == "ORG-GOV-01"
+
+    def test_iter_related_mappings_is_lazy(self, sdm_control: Control):
+        replace_related_mappings(sdm_control, [
+            RelatedMapping(scheme="sdm", value="TOM-03", remarks=None),
+            RelatedMapping(scheme="sdm", value="TOM-04", remarks=None),
+        ])
+        it = iter_related_mappings(sdm_control)
+        assert next(it).value == "TOM-03"
+        assert [m.value for m in it] == ["TOM-04"]
+        assert list(iter_related_mappings(sdm_control)) == extract_related_mappings(sdm_control)
+
+    def test_extract_sdm_bundle_matches_helpers(self, sdm_control: Control):
+        set_implementation_level(sdm_control, "full")
+        set_dp_risk_impact(sdm_control, "high")
+        replace_related_mappings(
+            sdm_control, [RelatedMapping(scheme="sdm", value="TOM-03", remarks=None)]
+        )
+        bundle = extract_sdm_bundle(sdm_control)
+        assert bundle.sdm_module == extract_sdm_module(sdm_control)
+        assert bundle.sdm_goals == extract_sdm_goals(sdm_control)
+        assert bundle.dsgvo_articles == extract_dsgvo_articles(sdm_control)
+        assert bundle.implementation_level == "full"
+        assert bundle.dp_risk_impact == "high"
+        assert bundle.related_mappings == extract_related_mappings(sdm_control)
+
+    def test_sdm_readers_use_extract_cache(self, sdm_control: Control):
+        with extract_cache():
+            first = extract_dsgvo_articles(sdm_control)
+            assert extract_dsgvo_articles(sdm_control) is first
+            assert extract_sdm_bundle(sdm_control) is extract_sdm_bundle(sdm_control)
+        assert extract_dsgvo_articles(sdm_control) is not first
+
     def test_extract_sdm_tom_description_none(self, sdm_control: Control):
         """No description part present -> None."""
         result = extract_sdm_tom_description(sdm_control)
@@ -180,6 +233,18 @@ class TestSdmCatalog:
         assert result == prose_text
 
 
+    def test_extract_sdm_tom_prose_map(self, sdm_control: Control):
+        assert extract_sdm_tom_prose_map(sdm_control) == {
+            "description": None,
+            "implementation-hints": None,
+        }
+        set_sdm_tom_implementation_hints(sdm_control, "Hinweise.")
+        set_sdm_tom_description(sdm_control, "Beschreibung.")
+        assert extract_sdm_tom_prose_map(sdm_control) == {
+            "description": "Beschreibung.",
+            "implementation-hints": "Hinweise.",
+        }
+
 # =====================================================================
 # Resilience Catalog tests (#4)
 # =====================================================================
@@ -211,6 +276,33 @@ class TestResilienceCatalog:
         result = extract_description(control)
         assert result == "Resilience measure prose text."
 
+    def test_extracts_memoized_in_extract_cache(self):
+        control = Control(id="RES-06", title="Test", props=[])
+        set_domain(control, "physical-security")
+        with extract_cache():
+            assert extract_domain(control) == "physical-security"
+            set_domain(control, "network")
+            assert extract_domain(control) == "physical-security"
+        assert extract_domain(control) == "network"
+
+    def test_extract_description_model_and_dict_parts(self):
+        model = Control(id="RES-04", title="Test", parts=[
+            Part(id="d", name="description", prose="model prose"),
+        ])
+        raw = Control(id="RES-05", title="Test")
+        parts_ref(raw).append({"id": "d", "name": "description", "prose": "dict prose"})
+        assert isinstance(parts_ref(raw)[0], dict)
+        assert extract_description(model) == "model prose"
+        assert extract_description(raw) == "dict prose"
+
+    def test_extract_description_dict_subclass_part(self):
+        class PartDict(dict):
+            pass
+
+        raw = Control(id="RES-06", title="Test")
+        parts_ref(raw).append(PartDict(id="d", name="description", prose="subclass prose"))
+        assert extract_description(raw) == "subclass prose"
+
 
 # =====================================================================
 # Privacy Control extract tests (#7)
@@ -256,6 +348,117 @@ class TestPrivacyControlExtract:
             assert len(texts[level]) > 0, f"Level {level} text should not be empty"
 
 
+    def test_extract_bundle_matches_individual_extractors(self):
+        """extract_bundle() agrees with the per-field helpers on every control."""
+        cat = _load_fixture()
+        for group in cat.groups:
+            for ctrl in group.controls:
+                bundle = extract_bundle(ctrl)
+                texts = extract_maturity_level_texts(ctrl)
+                assert bundle.legal_articles == extract_legal_articles(ctrl)
+                assert bundle.evidence_artifacts == extract_evidence_artifacts(ctrl)
+                assert bundle.maturity_domain == extract_maturity_domain(ctrl)
+                assert bundle.maturity_requirement == extract_maturity_requirement(ctrl)
+                assert bundle.measure_category == extract_measure_category(ctrl)
+                assert bundle.tom_id == extract_tom_id(ctrl)
+                assert bundle.dp_goals == list_dp_goals(ctrl)
+                assert bundle.statement == extract_statement(ctrl)
+                assert bundle.risk_hint == extract_risk_hint(ctrl)
+                assert bundle.risk_scenarios == extract_risk_scenarios(ctrl)
+                assert bundle.maturity_level_1 == texts[1]
+                assert bundle.maturity_level_3 == texts[3]
+                assert bundle.maturity_level_5 == texts[5]
+                assert bundle.typical_measures == list_typical_measures(ctrl)
+                assert bundle.assessment_questions == list_assessment_questions(ctrl)
+
+    def test_extract_bundle_does_not_create_containers(self):
+        ctrl = Control(id="test", title="Test")
+        bundle = extract_bundle(ctrl)
+        assert bundle.typical_measures == []
+        assert bundle.maturity_level_1 is None
+        assert ctrl.parts == []
+
+    def test_extract_cache_scope(self, catalog_control: Control):
+        """Results are memoized per control only inside extract_cache()."""
+        with extract_cache():
+            first = extract_legal_articles(catalog_control)
+            assert extract_legal_articles(catalog_control) is first
+            with extract_cache():
+                assert extract_legal_articles(catalog_control) is first
+        assert extract_legal_articles(catalog_control) is not first
+        assert extract_legal_articles(catalog_control) == first
+
+    def test_extract_cache_is_scoped_to_its_thread(self, catalog_control: Control):
+        """A scope open in one thread does not memoize reads in another."""
+        import threading
+
+        entered = threading.Event()
+        done = threading.Event()
+
+        def hold_scope() -> None:
+            with extract_cache():
+                extract_legal_articles(catalog_control)
+                entered.set()
+                done.wait()
+
+        holder = threading.Thread(target=hold_scope)
+        holder.start()
+        try:
+            entered.wait()
+            first = extract_legal_articles(catalog_control)
+            assert extract_legal_articles(catalog_control) is not first
+            catalog_control.props.clear()
+            assert extract_legal_articles(catalog_control) == []
+        finally:
+            done.set()
+            holder.join()
+
+    def test_extract_cache_keys_on_function(self, catalog_control: Control):
+        """Same-named memoized functions do not share entries."""
+        from opengov_oscal_pyprivacy.domain._extract import memoized
+
+        def make(value: str):
+            @memoized
+            def reader(control: Control) -> str:
+                return value
+            return reader
+
+        a, b = make("a"), make("b")
+        with extract_cache():
+            assert a(catalog_control) == "a"
+            assert b(catalog_control) == "b"
+
+    def test_extract_cache_forwards_extra_arguments(self, catalog_control: Control):
+        """Calls with more than the control pass through uncached."""
+        from opengov_oscal_pyprivacy.domain._extract import memoized
+
+        @memoized
+        def reader(control: Control, suffix: str = "") -> str:
+            return control.id + suffix
+
+        with extract_cache():
+            assert reader(catalog_control) == catalog_control.id
+            assert reader(catalog_control, "-x") == catalog_control.id + "-x"
+            assert reader(control=catalog_control) == catalog_control.id
+
+    def test_extract_with_explicit_parts(self, catalog_control: Control):
+        """Helpers read from a pre-resolved parts list when one is passed."""
+        parts = parts_ref(catalog_control)
+        assert extract_statement(catalog_control, parts=parts) == extract_statement(catalog_control)
+        assert extract_maturity_level_texts(catalog_control, parts=parts) == (
+            extract_maturity_level_texts(catalog_control)
+        )
+        with extract_cache():
+            extract_statement(catalog_control)
+            assert extract_statement(catalog_control, parts=[]) is None
+
+    def test_extract_cache_not_stale_after_scope(self, catalog_control: Control):
+        with extract_cache():
+            assert extract_statement(catalog_control) != "changed"
+        catalog_control.parts[0].prose = "changed"
+        assert extract_statement(catalog_control) == "changed"
+
+
 # =====================================================================
 # Evidence, Maturity-Domain/Requirement, Measure Category tests (#27)
 # =====================================================================
@@ -317,3 +520,21 @@ class TestExtractNewProperties:
         reg = [g for g in cat.groups if g.id == "REG"][0]
         ctrl = reg.controls[0]
         assert extract_measure_category(ctrl) == "process"
+
+    def test_categorical_values_are_interned(self):
+        """Equal maturity domains across controls share one string object."""
+        first = [g for g in _load_fixture().groups if g.id == "REG"][0].controls[0]
+        second = [g for g in _load_fixture().groups if g.id == "REG"][0].controls[0]
+        a = extract_maturity_domain(first)
+        b = extract_maturity_domain(second)
+        assert a == b
+        assert a is b
+
+    def test_vocabulary_lists_are_interned(self):
+        """Legal-article values from separate loads share one string object."""
+        first = [g for g in _load_fixture().groups if g.id == "REG"][0].controls[0]
+        second = [g for g in _load_fixture().groups if g.id == "REG"][0].controls[0]
+        a = extract_legal_articles(first)
+        b = extract_bundle(second).legal_articles
+        assert a and a == b
+        assert all(x is y for x, y in zip(a, b))
@@ -25,6 +25,7 @@ from opengov_oscal_pyprivacy.converters.dpia_converter import (
     control_to_dpia_detail,
     group_to_dpia_summary,
     group_to_dpia_detail,
+    iter_dpia_control_summaries,
 )
 from opengov_oscal_pyprivacy.dto.dpia import (
     DpiaControlSummary,
@@ -266,6 +267,13 @@ def test_group_to_dpia_detail_no_controls(dpia_group: Group):
     assert result.controls == []
 
 
+def test_iter_dpia_control_summaries_matches_group_detail(dpia_group: Group):
+    """The streaming iterator yields the same summaries as group_to_dpia_detail."""
+    stream = iter_dpia_control_summaries(dpia_group)
+    assert not isinstance(stream, list)
+    assert list(stream) == group_to_dpia_detail(dpia_group).controls
+
+
 # =====================================================================
 # 10. test_all_dpia_controls_convert
 # =====================================================================
@@ -177,6 +177,30 @@ class TestToJson:
             # ASCII version should contain no high-byte chars
             assert all(ord(c) < 128 for c in text_ascii)
 
+    @pytest.mark.parametrize("indent", [None, 0, 2, 4])
+    @pytest.mark.parametrize("root_key", [None, "catalog"])
+    def test_matches_json_dumps(self, catalog: Catalog, indent, root_key) -> None:
+        """to_json output is identical to json.dumps over to_dict."""
+        for ensure_ascii in (False, True):
+            expected = json.dumps(
+                to_dict(catalog, oscal_root_key=root_key),
+                indent=indent,
+                ensure_ascii=ensure_ascii,
+            )
+            text = to_json(
+                catalog, oscal_root_key=root_key, indent=indent, ensure_ascii=ensure_ascii,
+            )
+            assert text == expected
+
+    def test_extra_field_edge_values(self, catalog: Catalog) -> None:
+        """Small floats, NaN and control characters serialise as json.dumps does."""
+        edge = catalog.model_copy()
+        edge.__pydantic_extra__ = {"tiny": 1.5e-07, "nan": float("nan"), "ctl": "\x7f"}
+        text = to_json(edge, ensure_ascii=True)
+        assert '"tiny": 1.5e-07' in text
+        assert '"nan": NaN' in text
+        assert '"ctl": "\\u007f"' in text
+
 
 # ============================================================================
 # Roundtrip tests
@@ -114,3 +114,40 @@ def test_list_normalized_legal_ids_ignores_non_legal_props():
 
     ids = list_normalized_legal_ids(c)
     assert ids == ["EU:REG:GDPR:ART-5_ABS-2"]
+
+
+def test_normalize_legal_from_text_no_duplicates():
+    """Re-normalizing the same text reuses the existing legal props."""
+    c = _fresh_control()
+    add_legal_id(c, "EU:REG:GDPR:ART-24")
+    first = normalize_legal_from_text(c, "Art. 5 Abs. 2 DSGVO")
+    count = len(c.props)
+
+    again = normalize_legal_from_text(c, "Art. 5 Abs. 2 DSGVO")
+
+    assert again == first
+    assert len(c.props) == count
+    assert c.props[0].value == "EU:REG:GDPR:ART-24"
+
+
+def test_normalize_legal_from_text_parses_repeated_text_once(monkeypatch):
+    """The same legal text is parsed once across controls."""
+    from opengov_oscal_pyprivacy import legal_adapter
+
+    calls = []
+    real = legal_adapter.parse_norm_references
+
+    def counting(text):
+        calls.append(text)
+        return real(text)
+
+    monkeypatch.setattr(legal_adapter, "parse_norm_references", counting)
+    legal_adapter._parse_legal_refs.cache_clear()
+    try:
+        a = normalize_legal_from_text(_fresh_control(), "Art. 5 Abs. 2 DSGVO")
+        b = normalize_legal_from_text(_fresh_control(), "Art. 5 Abs. 2 DSGVO")
+    finally:
+        legal_adapter._parse_legal_refs.cache_clear()
+
+    assert a == b
+    assert calls == ["Art. 5 Abs. 2 DSGVO"]
@@ -22,6 +22,8 @@ from opengov_oscal_pyprivacy.domain.mapping import (
     delete_mapping,
     calculate_mapping_coverage,
     resolve_transitive_mappings,
+    MappingIndex,
+    CatalogLayout,
 )
 from opengov_oscal_pyprivacy.dto.mapping_workbench import (
     SdmSecurityMapping,
@@ -130,6 +132,16 @@ def test_upsert_mapping_insert(mapping_data):
     assert found.sdm_title == "Brand New Control"
 
 
+def test_upsert_mapping_unchanged_keeps_entry(mapping_data):
+    """Re-upserting an identical mapping leaves the stored dict untouched."""
+    mapping = get_mapping(mapping_data, "GOV-01")
+    upsert_mapping(mapping_data, mapping)
+    stored = mapping_data[0]
+
+    upsert_mapping(mapping_data, mapping)
+    assert mapping_data[0] is stored
+
+
 # ---------------------------------------------------------------------------
 # delete_mapping
 # ---------------------------------------------------------------------------
@@ -149,6 +161,73 @@ def test_delete_mapping_not_found(mapping_data):
     assert len(mapping_data) == original_len
 
 
+# ---------------------------------------------------------------------------
+# MappingIndex
+# ---------------------------------------------------------------------------
+
+def test_mapping_index_crud_matches_linear(mapping_data):
+    """Indexed CRUD gives the same results as the scanning variants."""
+    plain = copy.deepcopy(mapping_data)
+    idx = MappingIndex.build(mapping_data)
+    assert get_mapping(mapping_data, "GOV-02", index=idx) == get_mapping(plain, "GOV-02")
+
+    new_mapping = SdmSecurityMapping(sdm_control_id="NEW-01", sdm_title="New")
+    upsert_mapping(mapping_data, new_mapping, index=idx)
+    upsert_mapping(plain, new_mapping)
+    delete_mapping(mapping_data, "GOV-01", index=idx)
+    delete_mapping(plain, "GOV-01")
+
+    assert mapping_data == plain
+    assert (idx.by_id, idx.ids) == (
+        MappingIndex.build(plain).by_id, MappingIndex.build(plain).ids
+    )
+    assert get_mapping(mapping_data, "GOV-01", index=idx) is None
+    assert get_mapping(mapping_data, "NEW-01", index=idx).sdm_title == "New"
+    assert resolve_transitive_mappings(mapping_data, "GOV-02", index=idx) == (
+        resolve_transitive_mappings(plain, "GOV-02")
+    )
+
+
+def test_calculate_mapping_coverage_with_index(catalog, mapping_data):
+    """A prebuilt index yields the same coverage as the raw list."""
+    idx = MappingIndex.build(mapping_data)
+    assert calculate_mapping_coverage(catalog, mapping_data, index=idx) == (
+        calculate_mapping_coverage(catalog, mapping_data)
+    )
+
+
+def test_calculate_mapping_coverage_with_layout(catalog, mapping_data):
+    """A prebuilt catalog layout yields the same coverage as walking the catalog."""
+    layout = CatalogLayout.build(catalog)
+    assert sum(len(cids) for _, cids in layout.groups) == len(list(iter_controls(catalog)))
+    assert calculate_mapping_coverage(catalog, mapping_data, layout=layout) == (
+        calculate_mapping_coverage(catalog, mapping_data)
+    )
+
+
+def test_mapping_index_mapped_ids_follow_crud(catalog, mapping_data):
+    """Cached mapped IDs are refreshed after upserts and deletes."""
+    idx = MappingIndex.build(mapping_data)
+    assert "GOV-04" not in idx.mapped_ids()
+
+    upsert_mapping(
+        mapping_data,
+        SdmSecurityMapping(
+            sdm_control_id="GOV-04",
+            sdm_title="Now mapped",
+            standards=MappingStandards(bsi=["X.1"]),
+        ),
+        index=idx,
+    )
+    assert "GOV-04" in idx.mapped_ids()
+
+    delete_mapping(mapping_data, "GOV-01", index=idx)
+    assert "GOV-01" not in idx.mapped_ids()
+    assert calculate_mapping_coverage(catalog, mapping_data, index=idx) == (
+        calculate_mapping_coverage(catalog, mapping_data)
+    )
+
+
 # ---------------------------------------------------------------------------
 # calculate_mapping_coverage
 # ---------------------------------------------------------------------------
@@ -233,6 +312,54 @@ def test_resolve_transitive_mappings(mapping_data):
     assert "iso27001:A.5.1" in path.target_standards
 
 
+def test_resolve_transitive_mappings_full_closure():
+    """max_depth=None follows references breadth-first and stops at cycles."""
+    mappings = [
+        {"sdmControlId": "S", "securityControls": [{"controlId": "A"}, {"controlId": "B"}]},
+        {"sdmControlId": "A", "securityControls": [{"controlId": "C"}],
+         "standards": {"bsi": ["A.1"]}},
+        {"sdmControlId": "B", "securityControls": [{"controlId": "C"}]},
+        {"sdmControlId": "C", "securityControls": [{"controlId": "S"}],
+         "standards": {"iso27001": ["C.1"]}},
+    ]
+
+    direct = resolve_transitive_mappings(mappings, "S")
+    assert [p.path for p in direct] == [["S", "A"], ["S", "B"]]
+
+    paths = resolve_transitive_mappings(mappings, "S", max_depth=None)
+    assert [p.path for p in paths] == [
+        ["S", "A"],
+        ["S", "B"],
+        ["S", "A", "C"],
+        ["S", "B", "C"],
+        ["S", "A", "C", "S"],
+    ]
+    assert paths[0].target_standards == ["bsi:A.1"]
+    assert paths[3].target_standards == ["iso27001:C.1"]
+
+
+def test_resolve_transitive_mappings_duplicate_ids_last_wins():
+    """With duplicate IDs the last entry is used, indexed or not."""
+    mappings = [
+        {"sdmControlId": "S", "securityControls": [{"controlId": "B"}]},
+        {"sdmControlId": "S", "securityControls": [{"controlId": "A"}]},
+        {"sdmControlId": "A", "standards": {"bsi": ["first"]}},
+        {"sdmControlId": "A", "standards": {"bsi": ["second"]}},
+    ]
+    index = MappingIndex.build(mappings)
+    plain = resolve_transitive_mappings(mappings, "S")
+    indexed = resolve_transitive_mappings(mappings, "S", index=index)
+    assert plain == indexed
+    assert [p.path for p in plain] == [["S", "A"]]
+    assert plain[0].target_standards == ["bsi:second"]
+
+    delete_mapping(mappings, "A", index=index)
+    delete_mapping(mappings, "A", index=index)
+    assert resolve_transitive_mappings(mappings, "S", index=index) == (
+        resolve_transitive_mappings(mappings, "S")
+    )
+
+
 def test_resolve_transitive_mappings_not_found(mapping_data):
     """Unknown source returns empty list."""
     paths = resolve_transitive_mappings(mapping_data, "UNKNOWN-99")
@@ -33,6 +33,7 @@ from opengov_oscal_pycore.crud.parts import (
     delete_child_part,
     ensure_part_container,
     find_part,
+    parts_by_name,
     parts_ref,
     update_child_part,
 )
@@ -544,6 +545,17 @@ class TestFindPartModel:
         assert result.id == "p-2"
         assert result.name == "item"
 
+    def test_parts_by_name_first_wins(self):
+        parts = [
+            Part(name="item", id="p-1"),
+            {"name": "guidance", "prose": "dict"},
+            Part(name="item", id="p-2"),
+        ]
+        index = parts_by_name(parts)
+        assert index["item"] is find_part(parts, name="item")
+        assert index["guidance"]["prose"] == "dict"
+        assert set(index) == {"item", "guidance"}
+
     def test_find_part_not_found(self):
         parts = [Part(name="statement")]
         result = find_part(parts, name="nonexistent")
@@ -34,6 +34,7 @@ from opengov_oscal_pyprivacy.domain.privacy_control import (
     replace_risk_scenarios,
     extract_risk_scenarios,
     set_maturity_level_text,
+    set_maturity_levels,
     get_maturity_level_text,
     list_dp_goals,
     replace_dp_goals,
@@ -94,6 +95,16 @@ class TestTypicalMeasures:
         items = list_typical_measures(control)
         assert len(items) == 3
 
+    def test_add_typical_measure_continues_after_highest_id(self, control: Control):
+        """New ids follow the highest existing number, not the item count."""
+        add_typical_measure(control, "First measure")
+        id2 = add_typical_measure(control, "Second measure")
+        add_typical_measure(control, "Third measure")
+        delete_typical_measure(control, id2)
+
+        id4 = add_typical_measure(control, "Fourth measure")
+        assert id4.endswith("004")
+
     def test_update_typical_measure(self, control: Control):
         """Add, then update the prose text."""
         new_id = add_typical_measure(control, "Original text")
@@ -214,6 +225,24 @@ class TestMaturityLevelTexts:
         assert get_maturity_level_text(control, 3) == "Level 3: Managed"
         assert get_maturity_level_text(control, 5) == "Level 5: Optimized"
 
+    def test_set_maturity_levels_matches_single_setter(self, control: Control):
+        """The batched setter builds the same parts as three single calls."""
+        single = control.model_copy(deep=True)
+        texts = {1: "Level 1: Basic", 3: "Level 3: Managed", 5: "Level 5: Optimized"}
+        for level, prose in texts.items():
+            set_maturity_level_text(single, level, prose)
+
+        set_maturity_levels(control, texts)
+
+        assert control.parts == single.parts
+        assert get_maturity_level_text(control, 3) == "Level 3: Managed"
+
+    def test_set_maturity_levels_invalid(self, control: Control):
+        """An invalid level raises before any level is written."""
+        with pytest.raises(ValueError, match="level must be one of 1, 3, 5"):
+            set_maturity_levels(control, {1: "Level 1", 2: "Should fail"})
+        assert get_maturity_level_text(control, 1) is None
+
     def test_set_maturity_level_text_invalid(self, control: Control):
         """Level 2 is not valid and must raise ValueError."""
         with pytest.raises(ValueError, match="level must be one of 1, 3, 5"):
@@ -328,6 +357,15 @@ class TestRiskImpactScenarios:
         delete_risk_impact_scenario(control, "moderate")
         assert "moderate" not in get_risk_impact_scenarios(control)
 
+    def test_delete_risk_impact_scenario_keeps_other_levels(self, control: Control):
+        for level in ("normal", "moderate", "high"):
+            upsert_risk_impact_scenario(control, level, prose=f"{level} impact.")
+
+        delete_risk_impact_scenario(control, "moderate")
+        scenarios = get_risk_impact_scenarios(control)
+        assert sorted(scenarios) == ["high", "normal"]
+        assert scenarios["high"].prose == "high impact."
+
     def test_delete_risk_impact_scenario_nonexistent(self, control: Control):
         """Deleting a level that does not exist must not raise an error."""
         # Should silently do nothing
@@ -17,7 +17,7 @@ from pathlib import Path
 
 import pytest
 
-from opengov_oscal_pycore.models import Catalog, Control, Group, OscalMetadata
+from opengov_oscal_pycore.models import Catalog, Control, Group, OscalMetadata, Property
 from opengov_oscal_pycore.models_profile import ImportRef, Modify, Profile
 
 from opengov_oscal_pyprivacy.domain.profile import (
@@ -25,6 +25,7 @@ from opengov_oscal_pyprivacy.domain.profile import (
     build_profile_from_controls,
     resolve_profile_imports,
 )
+from opengov_oscal_pyprivacy.domain.privacy_control import add_typical_measure
 
 DATA_DIR = Path(__file__).parent / "data"
 
@@ -253,6 +254,101 @@ class TestResolveProfileImports:
         assert resolved.uuid != profile.uuid
         assert len(resolved.uuid) > 0
 
+    def test_resolve_loads_each_href_once(self, catalog: Catalog) -> None:
+        """Several imports of the same href load the catalog only once."""
+        profile = Profile(
+            uuid="loader-test",
+            metadata=OscalMetadata(title="Loader Test"),
+            imports=[
+                ImportRef(href="a.json", include_controls=[{"with-ids": ["GOV-01"]}]),
+                ImportRef(href="a.json", include_controls=[{"with-ids": ["ACC-01"]}]),
+                ImportRef(href="b.json", include_controls=[{"with-ids": ["LAW-01"]}]),
+            ],
+        )
+        calls: list[str] = []
+
+        def loader(href: str) -> Catalog:
+            calls.append(href)
+            return catalog
+
+        resolved = resolve_profile_imports(profile, loader)
+
+        assert calls == ["a.json", "b.json"]
+        all_ids = [c.id for g in resolved.groups for c in g.controls]
+        assert all_ids == ["GOV-01", "ACC-01", "LAW-01"]
+
+    def test_resolve_include_and_exclude(self, catalog: Catalog) -> None:
+        """Exclusions win over inclusions; an empty selection yields no groups."""
+        profile = Profile(
+            uuid="mixed-test",
+            metadata=OscalMetadata(title="Mixed Test"),
+            imports=[
+                ImportRef(
+                    href="x.json",
+                    include_controls=[{"with-ids": ["GOV-01", "GOV-02"]}],
+                    exclude_controls=[{"with-ids": ["GOV-02"]}],
+                ),
+                ImportRef(
+                    href="x.json",
+                    include_controls=[{"with-ids": ["ACC-01"]}],
+                    exclude_controls=[{"with-ids": ["ACC-01"]}],
+                ),
+            ],
+        )
+
+        resolved = resolve_profile_imports(profile, lambda _: catalog)
+
+        assert [c.id for g in resolved.groups for c in g.controls] == ["GOV-01"]
+
+    def test_resolve_copies_controls(self, catalog: Catalog) -> None:
+        """Resolved controls equal the source but do not share state with it."""
+        profile = Profile(
+            uuid="copy-test",
+            metadata=OscalMetadata(title="Copy Test"),
+            imports=[
+                ImportRef(
+                    href="x.json",
+                    include_controls=[{"with-ids": ["GOV-01"]}],
+                )
+            ],
+        )
+        source = catalog.groups[0].controls[0]
+
+        resolved = resolve_profile_imports(profile, lambda _: catalog)
+        copied = resolved.groups[0].controls[0]
+
+        assert copied == source
+        assert copied is not source
+        copied.props[0].value = "changed"
+        copied.parts[0].prose = "changed"
+        assert source.props[0].value != "changed"
+        assert source.parts[0].prose != "changed"
+
+    def test_resolve_keeps_in_place_edits(self) -> None:
+        """Props and parts appended after construction survive the copy."""
+        source = Control(id="X-01", title="Edited")
+        source.props.append(Property(name="a", value="1"))
+        add_typical_measure(source, "measure")
+        source.parts.append({"id": "x-01_raw", "name": "note", "prose": "raw"})
+        catalog = Catalog(
+            uuid="edit-cat",
+            metadata=OscalMetadata(title="Edited"),
+            groups=[Group(id="g", title="G", controls=[source])],
+        )
+        profile = Profile(
+            uuid="edit-test",
+            metadata=OscalMetadata(title="Edit Test"),
+            imports=[ImportRef(href="x.json", include_controls=[{"with-ids": ["X-01"]}])],
+        )
+
+        copied = resolve_profile_imports(profile, lambda _: catalog).groups[0].controls[0]
+
+        assert copied == source
+        assert copied.props[0].value == "1"
+        assert copied.parts[0].parts[0].prose == "measure"
+        assert copied.parts[1] == {"id": "x-01_raw", "name": "note", "prose": "raw"}
+        assert copied.parts[1] is not source.parts[1]
+
 
 # ============================================================================
 # build_profile_from_controls Tests
@@ -2,7 +2,7 @@ import json
 from pathlib import Path
 import pytest
 from opengov_oscal_pycore.models import Catalog, Control, Group, Property
-from opengov_oscal_pycore.crud_catalog import iter_controls_with_group, find_controls_by_prop
+from opengov_oscal_pycore.crud_catalog import iter_controls, iter_controls_with_group, find_controls_by_prop
 
 FIXTURE_FILE = Path(__file__).parent / "data" / "open_privacy_catalog_risk.json"
 
@@ -62,6 +62,9 @@ from opengov_oscal_pyprivacy.domain.query import (
     find_controls_by_legal_article,
     find_controls_by_evidence,
     find_controls_by_maturity_domain,
+    find_control_by_id,
+    build_prop_index,
+    query_cache,
 )
 
 class TestDomainQueryHelpers:
@@ -107,3 +110,60 @@ class TestNewQueryHelpers:
     def test_find_by_maturity_domain_nonexistent(self, catalog):
         found = find_controls_by_maturity_domain(catalog, "nonexistent-domain")
         assert found == []
+
+
+class TestPropIndex:
+    def test_indexed_queries_match_scans(self, catalog):
+        index = build_prop_index(catalog)
+        queries = [
+            find_controls_by_tom_id,
+            find_controls_by_implementation_level,
+            find_controls_by_legal_article,
+            find_controls_by_evidence,
+            find_controls_by_maturity_domain,
+        ]
+        values = {p.value for c in iter_controls(catalog) for p in c.props} | {"nonexistent"}
+        for query in queries:
+            for value in values:
+                assert query(catalog, value, index=index) == query(catalog, value)
+
+    def test_control_listed_once(self, simple_catalog):
+        simple_catalog.groups[0].controls[0].props.append(Property(name="level", value="full"))
+        index = build_prop_index(simple_catalog)
+        assert [c.id for c in index.by_value[("level", "full")]] == ["c1", "c3"]
+
+    def test_find_control_by_id(self, simple_catalog):
+        index = build_prop_index(simple_catalog)
+        c3 = simple_catalog.groups[1].controls[0]
+        assert find_control_by_id(simple_catalog, "c3") is c3
+        assert find_control_by_id(simple_catalog, "c3", index=index) is c3
+        assert find_control_by_id(simple_catalog, "nope", index=index) is None
+        with query_cache():
+            assert find_control_by_id(simple_catalog, "c3") is c3
+
+    def test_query_cache_scope(self, catalog, monkeypatch):
+        import opengov_oscal_pyprivacy.domain.query as query
+
+        builds = []
+        real_build = query.build_prop_index
+        monkeypatch.setattr(
+            query, "build_prop_index", lambda cat: builds.append(cat) or real_build(cat)
+        )
+        expected = find_controls_by_evidence(catalog, "dpia-report")
+        with query_cache():
+            assert find_controls_by_evidence(catalog, "dpia-report") == expected
+            assert find_controls_by_maturity_domain(catalog, "risk-management")
+        assert builds == [catalog]
+        find_controls_by_evidence(catalog, "dpia-report")
+        assert builds == [catalog]
+
+    def test_query_cache_skips_other_threads(self, simple_catalog):
+        from concurrent.futures import ThreadPoolExecutor
+
+        c9 = Control(id="c9", title="C9", props=[Property(name="level", value="full")])
+        with query_cache(), ThreadPoolExecutor(max_workers=1) as pool:
+            assert find_control_by_id(simple_catalog, "c9") is None
+            simple_catalog.groups[1].controls.append(c9)
+            # The worker walks the live catalog; this thread keeps its index.
+            assert pool.submit(find_control_by_id, simple_catalog, "c9").result() is c9
+            assert find_control_by_id(simple_catalog, "c9") is None
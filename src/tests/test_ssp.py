@@ -40,6 +40,7 @@ from opengov_oscal_pycore.models_ssp import (
 from opengov_oscal_pyprivacy.domain.ssp import (
     generate_implemented_requirements,
     attach_evidence_to_ssp,
+    index_implemented_requirements,
     get_import_profile_href,
 )
 
@@ -427,6 +428,19 @@ class TestAttachEvidenceToSsp:
         ir = ssp.control_implementation.implemented_requirements[0]
         assert len(ir.links) == 0
 
+    def test_links_resource_via_ir_index(self) -> None:
+        """A prebuilt IR index links to the same requirement as the scan."""
+        ssp = self._make_ssp()
+        ir_index = index_implemented_requirements(ssp)
+        assert list(ir_index) == ["GOV-01"]
+
+        attach_evidence_to_ssp(ssp, Resource(uuid="ev-5", title="E5"), "GOV-01", ir_index=ir_index)
+        attach_evidence_to_ssp(ssp, Resource(uuid="ev-6", title="E6"), "NONE", ir_index=ir_index)
+
+        ir = ssp.control_implementation.implemented_requirements[0]
+        assert [link.href for link in ir.links] == ["#ev-5"]
+        assert len(ssp.back_matter.resources) == 2
+
 
 # ============================================================================
 # get_import_profile_href